@@ -43,7 +43,7 @@ module "api_with_lambda" {
   lambda_handler   = "index.lambda_handler"
   lambda_runtime   = "python3.11"
   lambda_timeout   = 60
-  lambda_memory_size = 256
+  lambda_memory_size = 1792
 
   endpoint_path = "data"
   http_method   = "POST"
@@ -1,10 +1,22 @@
 import json
 import logging
-from datetime import datetime
+import os
+import time
 
 # Setup logging
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+# Static response headers, shared by every response
+RESPONSE_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
+def utc_timestamp():
+    """Current UTC time in ISO 8601 format with microseconds"""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanos // 1000:06d}"
 
 def lambda_handler(event, context):
     """
@@ -14,7 +26,9 @@ def lambda_handler(event, context):
     Returns: HTTP response with JSON
     """
     
-    logger.info(f"Received event: {json.dumps(event)}")
+    # Serializing the whole event is only worth it when it will be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
     
     try:
         # Get request body
@@ -28,7 +42,7 @@ def lambda_handler(event, context):
         
         # Process the request
         response_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': utc_timestamp(),
             'message': 'Request received and processed',
             'received_data': body_data,
             'http_method': event.get('httpMethod'),
@@ -42,10 +56,7 @@ def lambda_handler(event, context):
         return {
             'statusCode': 200,
             'body': json.dumps(response_data),
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            }
+            'headers': RESPONSE_HEADERS
         }
         
     except Exception as e:
@@ -54,8 +65,5 @@ def lambda_handler(event, context):
         return {
             'statusCode': 500,
             'body': json.dumps({'error': str(e)}),
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            }
+            'headers': RESPONSE_HEADERS
         }
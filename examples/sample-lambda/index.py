@@ -34,14 +34,30 @@ No parameter names or tokens are hardcoded in the Lambda.
 """
 
 import os
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 LOG = logging.getLogger()
 LOG.setLevel(logging.INFO)
 
+# Keep TLS connections alive so warm invocations reuse them instead of
+# renegotiating on every API call.
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+
+# Workload-account clients, built on first use and reused on warm starts.
+_CLIENTS = {}
+
+# Runs the STS calls alongside SSM pagination; kept across warm starts.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
 
 def get_env(name, required=False, default=None):
     """
@@ -72,43 +88,63 @@ def get_env(name, required=False, default=None):
     return value
 
 
-def fetch_parameters_by_path(ssm_client, path):
+def get_client(service, region=None):
     """
-    Fetch all parameters under a given SSM path using pagination.
+    Return a cached boto3 client for the workload account.
+
+    Clients are created lazily on first use and kept for the lifetime of
+    the execution environment, so only cold starts pay for loading the
+    botocore service model.
 
     Parameters:
     -----------
-    ssm_client : boto3.client("ssm")
-        SSM client.
-    path : str
-        Parameter path prefix.
+    service : str
+        AWS service name, e.g. "ssm" or "sts".
+    region : str | None
+        Optional region override.
 
     Returns:
     --------
-    list[dict]
-        List of parameter objects from SSM.
+    boto3.client
+        Client for the requested service.
     """
-    params = []
-    next_token = None
-
-    while True:
-        kwargs = {
-            "Path": path,
-            "Recursive": True,
-            "WithDecryption": True,
-            "MaxResults": 1000,
-        }
-        if next_token:
-            kwargs["NextToken"] = next_token
+    key = (service, region)
+    client = _CLIENTS.get(key)
+    if client is None:
+        kwargs = {"region_name": region} if region else {}
+        client = boto3.client(service, config=BOTO_CONFIG, **kwargs)
+        _CLIENTS[key] = client
+    return client
 
-        resp = ssm_client.get_parameters_by_path(**kwargs)
-        params.extend(resp.get("Parameters", []))
 
-        next_token = resp.get("NextToken")
-        if not next_token:
-            break
+def fetch_parameters_by_path(ssm_client, path):
+    """
+    Iterate over all parameters under a given SSM path.
 
-    return params
+    Pages are fetched lazily through the boto3 paginator, so parameters
+    can be consumed as they arrive instead of being collected into a list.
+
+    Parameters:
+    -----------
+    ssm_client : boto3.client("ssm")
+        SSM client.
+    path : str
+        Parameter path prefix.
+
+    Yields:
+    -------
+    dict
+        Parameter objects from SSM.
+    """
+    paginator = ssm_client.get_paginator("get_parameters_by_path")
+    pages = paginator.paginate(
+        Path=path,
+        Recursive=True,
+        WithDecryption=True,
+        PaginationConfig={"PageSize": 10},
+    )
+    for page in pages:
+        yield from page.get("Parameters", [])
 
 
 def normalize_param_name(name, old_token, new_token):
@@ -145,7 +181,7 @@ def assemble_payload(account_id, parameters, source_prefix, old_token, new_token
     -----------
     account_id : str
         Workload AWS Account ID.
-    parameters : list[dict]
+    parameters : Iterable[dict]
         SSM parameter records fetched from workload account.
     source_prefix : str
         Path prefix defining root of workload configuration.
@@ -165,17 +201,22 @@ def assemble_payload(account_id, parameters, source_prefix, old_token, new_token
         "Parameters": {},
     }
 
+    prefix_len = len(source_prefix) if source_prefix else 0
+    values = payload["Parameters"]
+
     for p in parameters:
         raw = p.get("Name", "")
 
         # Remove prefix
-        if source_prefix and raw.startswith(source_prefix):
-            key_segment = raw[len(source_prefix):]
+        if prefix_len and raw.startswith(source_prefix):
+            key_segment = raw[prefix_len:]
         else:
             key_segment = raw
 
-        normalized = normalize_param_name(key_segment, old_token, new_token)
-        payload["Parameters"][normalized] = p.get("Value")
+        # Same as normalize_param_name(), inlined for the per-parameter loop
+        if old_token:
+            key_segment = key_segment.replace(old_token, new_token)
+        values[key_segment.strip("/")] = p.get("Value")
 
     return payload
 
@@ -236,7 +277,8 @@ def handler(event, context):
         }
     """
 
-    LOG.info("Event: %s", json.dumps(event))
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("Event: %s", orjson.dumps(event).decode())
 
     source_prefix = get_env("SOURCE_PREFIX", required=True)
     old_token = get_env("OLD_TOKEN", required=False, default=None)
@@ -249,27 +291,34 @@ def handler(event, context):
     if region:
         session_kwargs["region_name"] = region
 
-    ssm = boto3.client("ssm", **session_kwargs)
-    sts = boto3.client("sts", **session_kwargs)
+    ssm = get_client("ssm", region)
+    sts = get_client("sts", region)
 
-    # workload account id
-    acct = sts.get_caller_identity()["Account"]
+    # The STS calls do not depend on each other or on SSM, so issue them
+    # up front and let both complete while parameters are paged in.
+    acct_future = _EXECUTOR.submit(sts.get_caller_identity)
+    creds_future = _EXECUTOR.submit(assume_role, sts, central_role_arn)
 
-    params = fetch_parameters_by_path(ssm, source_prefix)
-    LOG.info("Fetched %d parameters", len(params))
+    # Page everything in now; the generator is lazy and would otherwise only
+    # start paging inside assemble_payload, after the STS result is awaited.
+    params = list(fetch_parameters_by_path(ssm, source_prefix))
 
+    # workload account id
+    acct = acct_future.result()["Account"]
     payload = assemble_payload(acct, params, source_prefix, old_token, new_token)
-    payload_json = json.dumps(payload, separators=(",", ":"))
+    LOG.info("Fetched %d parameters", len(payload["Parameters"]))
+    payload_json = orjson.dumps(payload).decode()
 
     dest_param = central_param_prefix.rstrip("/") + "/" + acct
 
-    creds = assume_role(sts, central_role_arn)
+    creds = creds_future.result()
 
     central_ssm = boto3.client(
         "ssm",
         aws_access_key_id=creds["aws_access_key_id"],
         aws_secret_access_key=creds["aws_secret_access_key"],
         aws_session_token=creds["aws_session_token"],
+        config=BOTO_CONFIG,
         **session_kwargs,
     )
 
@@ -1,5 +1,6 @@
 import os
 import json
+import threading
 import pytest
 from unittest import mock
 
@@ -8,6 +9,7 @@ from lambda_code.index import (
     normalize_param_name,
     assemble_payload,
     fetch_parameters_by_path,
+    get_client,
     handler,
 )
 
@@ -43,17 +45,30 @@ def test_assemble_payload():
 
 def test_fetch_parameters_by_path_pagination():
     client = mock.Mock()
-    client.get_parameters_by_path.side_effect = [
+    paginator = client.get_paginator.return_value
+    paginator.paginate.return_value = [
         {"Parameters": [{"Name": "/p/a", "Value": "1"}], "NextToken": "t1"},
         {"Parameters": [{"Name": "/p/b", "Value": "2"}]},
     ]
 
-    params = fetch_parameters_by_path(client, "/p/")
+    params = list(fetch_parameters_by_path(client, "/p/"))
+    client.get_paginator.assert_called_once_with("get_parameters_by_path")
     assert len(params) == 2
     assert any(p["Name"] == "/p/a" for p in params)
     assert any(p["Name"] == "/p/b" for p in params)
 
 
+@mock.patch("lambda_code.index.boto3.client")
+def test_get_client_reuses_client(mock_client, monkeypatch):
+    monkeypatch.setattr("lambda_code.index._CLIENTS", {})
+
+    first = get_client("ssm", "eu-west-2")
+    second = get_client("ssm", "eu-west-2")
+
+    assert first is second
+    mock_client.assert_called_once()
+
+
 @mock.patch("lambda_code.index.boto3.client")
 def test_handler_end_to_end(mock_client, monkeypatch):
 
@@ -62,6 +77,7 @@ def test_handler_end_to_end(mock_client, monkeypatch):
     monkeypatch.setenv("NEW_TOKEN", "newsolution")
     monkeypatch.setenv("CENTRAL_ROLE_ARN", "arn:aws:iam::222233334444:role/CentralRole")
     monkeypatch.setenv("CENTRAL_SSM_PARAM_PREFIX", "/central-config/")
+    monkeypatch.setattr("lambda_code.index._CLIENTS", {})
 
     fake_ssm = mock.Mock()
     fake_sts = mock.Mock()
@@ -87,11 +103,11 @@ def test_handler_end_to_end(mock_client, monkeypatch):
         }
     }
 
-    fake_ssm.get_parameters_by_path.return_value = {
-        "Parameters": [
+    fake_ssm.get_paginator.return_value.paginate.return_value = [
+        {"Parameters": [
             {"Name": "/prefix/oldtoken/keyA", "Value": "123"}
-        ]
-    }
+        ]}
+    ]
 
     result = handler({"trigger": "test"}, None)
 
@@ -101,3 +117,44 @@ def test_handler_end_to_end(mock_client, monkeypatch):
     assert kwargs["Name"].endswith("111122223333")
     assert "newsolution" in kwargs["Value"]
     assert result["status"] == "ok"
+
+
+@mock.patch("lambda_code.index.boto3.client")
+def test_handler_pages_ssm_before_awaiting_sts(mock_client, monkeypatch):
+    monkeypatch.setenv("SOURCE_PREFIX", "/prefix/")
+    monkeypatch.setenv("NEW_TOKEN", "newsolution")
+    monkeypatch.setenv("CENTRAL_ROLE_ARN", "arn:aws:iam::222233334444:role/CentralRole")
+    monkeypatch.setattr("lambda_code.index._CLIENTS", {})
+
+    fake_ssm = mock.Mock()
+    fake_sts = mock.Mock()
+    mock_client.side_effect = lambda service, **kwargs: (
+        fake_sts if service == "sts" else fake_ssm
+    )
+
+    paging_started = threading.Event()
+    overlapped = []
+
+    def pages(**kwargs):
+        paging_started.set()
+        yield {"Parameters": [{"Name": "/prefix/keyA", "Value": "123"}]}
+
+    def get_caller_identity():
+        # Only returns promptly if SSM paging began while this call was in flight
+        overlapped.append(paging_started.wait(timeout=5))
+        return {"Account": "111122223333"}
+
+    fake_ssm.get_paginator.return_value.paginate.side_effect = pages
+    fake_sts.get_caller_identity.side_effect = get_caller_identity
+    fake_sts.assume_role.return_value = {
+        "Credentials": {
+            "AccessKeyId": "X",
+            "SecretAccessKey": "Y",
+            "SessionToken": "Z",
+        }
+    }
+
+    result = handler({"trigger": "test"}, None)
+
+    assert overlapped == [True]
+    assert result["status"] == "ok"
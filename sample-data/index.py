@@ -2,7 +2,18 @@ import logging
 import json
 import os
 import boto3
+from botocore.config import Config
 import fnmatch
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses parameter values faster when it is packaged with the function
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 AWS_REGION = os.getenv("AWS_REGION", "eu-west-2")
 VARIABLE_LOGGING_NAME = os.getenv("VARIABLE_LOGGING_NAME", "cpl")
@@ -16,6 +27,8 @@ FILTERS_TRACKING_PARAM = os.getenv(
     f"{VARIABLE_LOGGING_NAME.title().replace('_', '')}_Filters"
 )
 SENDER_FUNCTION_NAME = os.getenv("SENDER_FUNCTION_NAME")
+# Upper bound on concurrent CloudWatch Logs calls, kept low to stay clear of API throttling
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "16"))
 # Set up logger
 logger = logging.getLogger("LambdaLogger")
 logging_level = os.getenv("LOGGING_LEVEL", "INFO").upper()
@@ -23,8 +36,31 @@ logging.basicConfig(level=logging_level)
 logger.setLevel(logging_level)
 
 # Set up global boto3 clients
-cloudwatch_logs_client = boto3.client("logs", region_name=AWS_REGION)
-ssm_client = boto3.client("ssm", region_name=AWS_REGION)
+# Adaptive retries back off client-side when CloudWatch Logs or SSM start throttling,
+# and the pool is sized to the worker count so concurrent calls do not queue for a connection
+boto_config = Config(
+    max_pool_connections=MAX_CONCURRENT_REQUESTS,
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
+cloudwatch_logs_client = boto3.client("logs", region_name=AWS_REGION, config=boto_config)
+ssm_client = boto3.client("ssm", region_name=AWS_REGION, config=boto_config)
+sts_client = boto3.client("sts", region_name=AWS_REGION)
+
+# Account ID is fixed for the life of the execution environment, so resolve it once per cold start
+ACCOUNT_ID = os.getenv("AWS_ACCOUNT_ID") or sts_client.get_caller_identity()["Account"]
+# Sender Lambda that every Subscription Filter points at
+DESTINATION_ARN = f"arn:aws:lambda:{AWS_REGION}:{ACCOUNT_ID}:function:{SENDER_FUNCTION_NAME}"
+
+# Parsed `SSM_PARAMETER_ROOT` parameters with their compiled patterns, loaded once per invocation
+parameters_cache = None
+# Combined regex of the cached parameters' log group name patterns
+parameters_matcher = None
+# `FILTERS_TRACKING_PARAM` entries, read at most once per invocation
+tracking_cache = None
+# Whether `tracking_cache` has changes that are not yet saved to Parameter Store
+tracking_changed = False
+# CloudWatch log groups from the first full listing of an invocation
+log_groups_cache = None
 
 
 
@@ -36,10 +72,84 @@ def get_parameters_generator():
         list[dict]: The parameter objects under the `SSM_PARAMETER_ROOT` hierarchy
     """
     paginator = ssm_client.get_paginator("get_parameters_by_path")
-    for page in paginator.paginate(Path=SSM_PARAMETER_ROOT, Recursive=True):
+    # 10 is the GetParametersByPath maximum
+    for page in paginator.paginate(
+        Path=SSM_PARAMETER_ROOT, Recursive=True, PaginationConfig={"PageSize": 10}
+    ):
         yield from page["Parameters"]
 
 
+def get_all_parameters(force_refresh=False):
+    """Gets all parameters under the `SSM_PARAMETER_ROOT` hierarchy with their values parsed
+
+    Parameter Store is only paginated on the first call of an invocation, later calls reuse the result.
+    Each "log_group_name_pattern" is compiled alongside its parameter so matching never re-translates the glob.
+
+    Args:
+        force_refresh (bool): Re-read the parameters even if they are already cached
+
+    Returns:
+        list[tuple[str, dict, re.Pattern]]: The parameter names, parsed JSON values and compiled patterns
+    """
+    global parameters_cache, parameters_matcher
+    if parameters_cache is None or force_refresh:
+        parameters_cache = []
+        for parameter in get_parameters_generator():
+            json_data = json_loads(parameter["Value"])
+            parameters_cache.append(
+                (
+                    parameter["Name"],
+                    json_data,
+                    re.compile(fnmatch.translate(json_data["log_group_name_pattern"])),
+                )
+            )
+        parameters_matcher = None
+    return parameters_cache
+
+
+def compile_patterns(patterns):
+    """Compiles glob patterns into a single regex
+
+    Each pattern is wrapped in a named group `p<index>`, so `match.lastgroup` identifies the first
+    pattern that matched.
+
+    Args:
+        patterns (list[str]): The glob patterns to combine
+
+    Returns:
+        re.Pattern: A regex matching any name matched by one of the patterns
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile(
+        "|".join(
+            f"(?P<p{index}>{fnmatch.translate(pattern)})"
+            for index, pattern in enumerate(patterns)
+        )
+    )
+
+
+def match_parameter(log_group_name):
+    """Finds the first parameter whose "log_group_name_pattern" matches a log group
+
+    Args:
+        log_group_name (str): The name of the log group to match
+
+    Returns:
+        dict: The parsed value of the matching parameter, or None if no pattern matches
+    """
+    global parameters_matcher
+    parameters = get_all_parameters()
+    if parameters_matcher is None:
+        parameters_matcher = compile_patterns(
+            [json_data["log_group_name_pattern"] for _, json_data, _ in parameters]
+        )
+    match = parameters_matcher.match(log_group_name)
+    if match is None:
+        return None
+    return parameters[int(match.lastgroup[1:])][1]
+
+
 def get_prefix(json_data):
     """
     Args:
@@ -52,7 +162,7 @@ def get_prefix(json_data):
     prefix = "[]"
     if "prefix" in json_data:
         prefix = json_data["prefix"]
-        logger.debug(f"Prefix Loaded: {prefix}")
+        logger.debug("Prefix Loaded: %s", prefix)
         if (prefix != "") and (prefix != "[]"):
             prefix = "%^" + prefix + "*%"
     else:
@@ -61,9 +171,79 @@ def get_prefix(json_data):
     return prefix
 
 
+def get_tracking_list():
+    """Gets the `FILTERS_TRACKING_PARAM` entries
+
+    Parameter Store is only read on the first call of an invocation, later calls return the same list.
+    Changes made through `add_tracking_entry` are written back by `save_tracking_list`.
+
+    Returns:
+        list[str]: The tracked log group names and patterns
+
+    Raises:
+        Exception: Any read failure other than the parameter not existing, so a partial list is never saved
+    """
+    global tracking_cache
+    if tracking_cache is None:
+        try:
+            base_param = ssm_client.get_parameter(Name=FILTERS_TRACKING_PARAM)
+            tracking_cache = base_param["Parameter"]["Value"].split(",")
+        except ssm_client.exceptions.ParameterNotFound as error:
+            tracking_cache = []
+            logger.info(f"{error} No {FILTERS_TRACKING_PARAM} Param Yet")
+    return tracking_cache
+
+
+def add_tracking_entry(entry):
+    """Adds a log group name or pattern to the cached tracking list if it is not already there
+
+    Args:
+        entry (str): The log group name or pattern to track
+    """
+    global tracking_changed
+    tracking_list = get_tracking_list()
+    if entry not in tracking_list:
+        tracking_list.append(entry)
+        tracking_changed = True
+
+
+def replace_tracking_list(entries):
+    """Replaces the tracking list with a new set of entries and saves it
+
+    Args:
+        entries (list[str]): The log group names or patterns to track
+    """
+    global tracking_cache, tracking_changed
+    tracking_cache = list(entries)
+    tracking_changed = True
+    save_tracking_list()
+
+
+def save_tracking_list():
+    """Writes the cached tracking list to `FILTERS_TRACKING_PARAM` if it has unsaved changes"""
+    global tracking_changed
+    if tracking_changed:
+        subscription_filter_param(tracking_cache)
+        tracking_changed = False
+
+
+def delete_tracking_param():
+    """Deletes `FILTERS_TRACKING_PARAM` and discards any unsaved tracking changes"""
+    global tracking_cache, tracking_changed
+    tracking_cache = []
+    tracking_changed = False
+    try:
+        ssm_client.delete_parameter(Name=FILTERS_TRACKING_PARAM)
+        logger.info(f"Deleted {FILTERS_TRACKING_PARAM} SSM parameter")
+    except ssm_client.exceptions.ParameterNotFound:
+        logger.debug(f"{FILTERS_TRACKING_PARAM} parameter does not exist")
+
+
 def add_subscription_filter(log_group_name, prefix=None):
     """Adds a Subscription Filter to a log group pointing to a given Lambda function
 
+    The log group is recorded in the cached tracking list, which is saved at the end of the invocation
+
     Args:
         log_group_name (str): The name of the log group to add the Subscription Filter to
         prefix (str): Subscription Filter prefix for logs
@@ -72,45 +252,30 @@ def add_subscription_filter(log_group_name, prefix=None):
     """
     if prefix is None:
         logger.debug("No Prefix Parameter")
-        parameters = [item for item in get_parameters_generator()]
-        for parameter in parameters:
-            json_data = json.loads(parameter["Value"])
-            if bool(
-                fnmatch.filter(
-                    [log_group_name], json_data["log_group_name_pattern"]
-                )
-            ):
-                prefix = get_prefix(json_data)
-                break
-        logger.info(f"Prefix Loaded From Store: {prefix}")
+        json_data = match_parameter(log_group_name)
+        if json_data is not None:
+            prefix = get_prefix(json_data)
+        logger.info("Prefix Loaded From Store: %s", prefix)
     else:
-        logger.debug(f"Prefix Parameter Loaded: {prefix}")
+        logger.debug("Prefix Parameter Loaded: %s", prefix)
 
-    logger.info(f"Applying Prefix: {prefix}")
-    account_id = (
-        boto3.client("sts", region_name=AWS_REGION)
-        .get_caller_identity()
-        .get("Account")
-    )
+    logger.info("Applying Prefix: %s", prefix)
     try:
         cloudwatch_logs_client.put_subscription_filter(
-            destinationArn=f"arn:aws:lambda:{AWS_REGION}:{account_id}:function:{SENDER_FUNCTION_NAME}",
+            destinationArn=DESTINATION_ARN,
             filterName=FILTER_NAME,
             filterPattern=prefix,
             logGroupName=log_group_name,
         )
-        base_param = ssm_client.get_parameter(Name=FILTERS_TRACKING_PARAM)
-        logGroupList = base_param["Parameter"]["Value"].split(",")
+        logGroupList = get_tracking_list()
         logger.debug(logGroupList)
 
         # Ensures that multiple entries of the same log group do not appear (in case of matching to multiple groups)
-        # log_group_name in logGroupList
-        if any(fnmatch.fnmatch(log_group_name, x) for x in logGroupList):
-            pass
-        else:
-            logGroupList.append(log_group_name)
-
-        subscription_filter_param(logGroupList)
+        # Entries may be patterns, so fall back to a single combined glob match when there is no exact entry
+        if log_group_name not in logGroupList and not compile_patterns(
+            logGroupList
+        ).match(log_group_name):
+            add_tracking_entry(log_group_name)
 
     except Exception as error:
         logger.error(f"Failed to add Subscription Filter: {error}")
@@ -123,15 +288,9 @@ def add_subscription_filter_to_new_log_group(log_group_name):
     Args:
         log_group_name (str): The name of the log group to add a Subscription Filter to
     """
-    parameters = [item for item in get_parameters_generator()]
-    for parameter in parameters:
-        json_data = json.loads(parameter["Value"])
-        prefix = get_prefix(json_data)
-        if bool(
-            fnmatch.filter(
-                [log_group_name], json_data["log_group_name_pattern"]
-            )
-        ):
+    for _, json_data, pattern_regex in get_all_parameters():
+        if pattern_regex.match(log_group_name):
+            prefix = get_prefix(json_data)
             logger.info(
                 f"{log_group_name} matches {json_data['log_group_name_pattern']} pattern. Adding Subscription Filter"
             )
@@ -142,13 +301,24 @@ def add_subscription_filter_to_new_log_group(log_group_name):
 def describe_log_groups_generator():
     """Gets all CloudWatch log groups in a given AWS region
 
+    The first listing to run to completion in an invocation is cached, so a PutParameter event's
+    update and reconcile steps share one pass over DescribeLogGroups
+
     Yields:
         list[dict]: The CloudWatch log groups
     """
-    cloudwatch_logs_client = boto3.client("logs", region_name=AWS_REGION)
+    global log_groups_cache
+    if log_groups_cache is not None:
+        yield from log_groups_cache
+        return
+
+    log_groups = []
     paginator = cloudwatch_logs_client.get_paginator("describe_log_groups")
-    for page in paginator.paginate():
+    # 50 is the DescribeLogGroups maximum, the default page size is smaller
+    for page in paginator.paginate(PaginationConfig={"PageSize": 50}):
+        log_groups.extend(page["logGroups"])
         yield from page["logGroups"]
+    log_groups_cache = log_groups
 
 
 def get_matching_log_groups(parameter_name, log_groups):
@@ -156,22 +326,23 @@ def get_matching_log_groups(parameter_name, log_groups):
 
     Args:
         parameter_name (str): The name of the parameter to look up in Parameter Store
-        log_groups (list[str]): The array of log groups to pattern match against
+        log_groups (Iterable[str]): The log groups to pattern match against
 
     Returns:
-        list[str]: An array of matching log groups
+        Iterator[str]: The matching log groups, produced lazily as `log_groups` is consumed
         dict: The parameter object
     """
-    response = ssm_client.get_parameter(Name=parameter_name)
-    parameter_info = json.loads(response["Parameter"]["Value"])
-    matched_log_groups = []
-    for log_group in log_groups:
-        if bool(
-            fnmatch.filter(
-                [log_group], parameter_info["log_group_name_pattern"]
-            )
-        ):
-            matched_log_groups.append(log_group)
+    for name, parameter_info, pattern_regex in get_all_parameters():
+        if name == parameter_name:
+            break
+    else:
+        # Not under the paginated hierarchy, fall back to a direct lookup
+        response = ssm_client.get_parameter(Name=parameter_name)
+        parameter_info = json_loads(response["Parameter"]["Value"])
+        pattern_regex = re.compile(
+            fnmatch.translate(parameter_info["log_group_name_pattern"])
+        )
+    matched_log_groups = filter(pattern_regex.match, log_groups)
     return matched_log_groups, parameter_info
 
 
@@ -181,45 +352,62 @@ def update_subscription_filter_on_existing_log_groups(parameter_name):
     Args:
         parameter_name (str): The name of the parameter to look up in Parameter Store
     """
-    all_log_groups = [
+    # Log groups are matched page by page as they are listed, rather than collected first
+    all_log_groups = (
         item["logGroupName"] for item in describe_log_groups_generator()
-    ]
+    )
     matched_log_groups, parameter_info = get_matching_log_groups(
         parameter_name, all_log_groups
     )
 
-    if len(matched_log_groups) == 0:
+    matched_count = 0
+    for log_group in matched_log_groups:
+        matched_count += 1
+        logGroupToAdd = ""
+        json_data = match_parameter(log_group)
+        if json_data is not None:
+            logGroupToAdd = str(json_data["log_group_name_pattern"])
+        add_tracking_entry(logGroupToAdd)
+
+        logger.info(
+            "%s matches %s pattern. Adding Subscription Filter",
+            log_group,
+            parameter_info["log_group_name_pattern"],
+        )
+        add_subscription_filter(log_group)
+
+    if matched_count == 0:
         logger.info(
             "No log group to add Subscription Filters to. Exiting Lambda."
         )
-        return
 
-    for log_group in matched_log_groups:
-        logGroupListNew = []
-        logGroupToAdd = ""
-        parameters = [item for item in get_parameters_generator()]
-        for parameter in parameters:
-            json_data = json.loads(parameter["Value"])
-            if bool(
-                fnmatch.filter([log_group], json_data["log_group_name_pattern"])
-            ):
-                logGroupToAdd = str(json_data["log_group_name_pattern"])
 
-        try:
-            base_param = ssm_client.get_parameter(Name=FILTERS_TRACKING_PARAM)
-            logGroupList = base_param["Parameter"]["Value"].split(",")
-            if logGroupToAdd not in logGroupList:
-                logGroupList.append(logGroupToAdd)
-            logGroupListNew = logGroupList
-        except Exception as error:
-            logGroupListNew.append(logGroupToAdd)
-            logger.info(f"{error} No {FILTERS_TRACKING_PARAM} Param Yet")
-        subscription_filter_param(logGroupListNew)
+def has_subscription_filter(log_group_name):
+    """Checks whether a log group currently has our subscription filter
 
-        logger.info(
-            f"{log_group} matches {parameter_info['log_group_name_pattern']} pattern. Adding Subscription Filter"
+    Args:
+        log_group_name (str): The name of the log group to check
+
+    Returns:
+        bool: True if the filter is present, False if it is absent or could not be checked
+    """
+    try:
+        filters = cloudwatch_logs_client.describe_subscription_filters(
+            logGroupName=log_group_name,
+            filterNamePrefix=FILTER_NAME,
         )
-        add_subscription_filter(log_group)
+
+        if filters["subscriptionFilters"]:
+            logger.debug("Found filter on: %s", log_group_name)
+            return True
+    except cloudwatch_logs_client.exceptions.ResourceNotFoundException:
+        # Log group was deleted between describe_log_groups and describe_subscription_filters
+        logger.debug("Log group no longer exists: %s", log_group_name)
+    except Exception as error:
+        logger.warning(
+            "Could not check filters for %s: %s", log_group_name, error
+        )
+    return False
 
 
 def get_log_groups_with_filters():
@@ -227,39 +415,78 @@ def get_log_groups_with_filters():
 
     This function queries the actual CloudWatch Logs state to find which log groups
     have our auto-created filter, providing a source-of-truth approach
-    that is resilient to drift and manual changes.
+    that is resilient to drift and manual changes. The per-log-group lookups are
+    issued concurrently, up to `MAX_CONCURRENT_REQUESTS` at a time.
 
-    Returns:
-        list[str]: List of log group names that have our subscription filter
+    Yields:
+        str: The names of log groups that have our subscription filter
     """
-    log_groups_with_filters = []
     logger.info(
         f"Scanning all log groups to find those with {VARIABLE_LOGGING_NAME} filters..."
     )
 
-    for log_group in describe_log_groups_generator():
-        log_group_name = log_group["logGroupName"]
-        try:
-            filters = cloudwatch_logs_client.describe_subscription_filters(
-                logGroupName=log_group_name,
-                filterNamePrefix=FILTER_NAME,
-            )
+    log_group_names = [
+        log_group["logGroupName"] for log_group in describe_log_groups_generator()
+    ]
+    executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+    try:
+        has_filter = executor.map(has_subscription_filter, log_group_names)
+        for log_group_name, found in zip(log_group_names, has_filter):
+            if found:
+                yield log_group_name
+    finally:
+        # A caller that stops early does not wait for lookups that have not started
+        executor.shutdown(wait=True, cancel_futures=True)
 
-            if filters["subscriptionFilters"]:
-                log_groups_with_filters.append(log_group_name)
-                logger.debug(f"Found filter on: {log_group_name}")
-        except cloudwatch_logs_client.exceptions.ResourceNotFoundException:
-            # Log group was deleted between describe_log_groups and describe_subscription_filters
-            logger.debug(f"Log group no longer exists: {log_group_name}")
-        except Exception as error:
-            logger.warning(
-                f"Could not check filters for {log_group_name}: {error}"
-            )
+
+def remove_subscription_filter(log_group_name):
+    """Removes our subscription filter from a log group
+
+    Failures are logged rather than raised so one log group cannot stop the cleanup of the others.
+
+    Args:
+        log_group_name (str): The name of the log group to remove the filter from
+
+    Returns:
+        bool: True if the filter is gone, False if the removal failed
+    """
+    try:
+        cloudwatch_logs_client.delete_subscription_filter(
+            filterName=FILTER_NAME,
+            logGroupName=log_group_name,
+        )
+        logger.info("Successfully removed filter from %s", log_group_name)
+    except cloudwatch_logs_client.exceptions.ResourceNotFoundException:
+        # Filter or log group no longer exists - this is fine
+        logger.info("Filter or log group already gone: %s", log_group_name)
+    except Exception as error:
+        logger.error(
+            "Failed to remove filter from %s: %s", log_group_name, error
+        )
+        return False
+    return True
+
+
+def get_current_patterns():
+    """Get the log group name patterns of all current SSM parameters.
+
+    Returns:
+        list[str]: The patterns that SHOULD have filters, in parameter order
+    """
+    current_patterns = []
+    try:
+        for _, json_data, _ in get_all_parameters():
+            pattern = json_data["log_group_name_pattern"]
+            current_patterns.append(pattern)
+            logger.debug("Active pattern: %s", pattern)
+    except Exception as error:
+        logger.error(f"Failed to retrieve SSM parameters: {error}")
+        raise error
 
     logger.info(
-        f"Found {len(log_groups_with_filters)} log groups with {VARIABLE_LOGGING_NAME} filters"
+        f"Found {len(current_patterns)} active pattern(s) in SSM parameters"
     )
-    return log_groups_with_filters
+    return current_patterns
 
 
 def reconcile_subscription_filters():
@@ -275,89 +502,67 @@ def reconcile_subscription_filters():
     """
     logger.info("Starting subscription filter cleanup process...")
 
-    # Step 1: Get all current patterns that SHOULD have filters
-    current_patterns = []
-    try:
-        parameters = [item for item in get_parameters_generator()]
-        for parameter in parameters:
-            json_data = json.loads(parameter["Value"])
-            pattern = json_data["log_group_name_pattern"]
-            current_patterns.append(pattern)
-            logger.debug(f"Active pattern: {pattern}")
-    except Exception as error:
-        logger.error(f"Failed to retrieve SSM parameters: {error}")
-        raise error
+    # Step 1 (get all current patterns that SHOULD have filters) does not depend on
+    # step 2, so Parameter Store is read in the background while the CloudWatch scan
+    # starts. The patterns are waited on when the first filtered log group is found,
+    # and a failure to read them stops the scan there.
+    filters_to_remove = []
+    filters_to_keep_count = 0
+    patterns_regex = None
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        patterns_future = executor.submit(get_current_patterns)
+
+        # Step 2 & 3: Find ALL log groups that ACTUALLY have our subscription filter
+        # and classify each one as it is found
+        for log_group_name in get_log_groups_with_filters():
+            if patterns_regex is None:
+                current_patterns = patterns_future.result()
+                patterns_regex = compile_patterns(current_patterns)
+
+            match = patterns_regex.match(log_group_name)
+
+            if match is not None:
+                matched_pattern = current_patterns[int(match.lastgroup[1:])]
+                filters_to_keep_count += 1
+                logger.debug(
+                    "Keeping filter on %s (matches %s)", log_group_name, matched_pattern
+                )
+            else:
+                filters_to_remove.append(log_group_name)
+                logger.info(
+                    "Will remove filter from %s (no matching pattern)", log_group_name
+                )
+
+        current_patterns = patterns_future.result()
 
     logger.info(
-        f"Found {len(current_patterns)} active pattern(s) in SSM parameters"
+        f"Found {filters_to_keep_count + len(filters_to_remove)} log groups with {VARIABLE_LOGGING_NAME} filters"
     )
 
-    # Step 2: Find ALL log groups that ACTUALLY have our subscription filter
-    log_groups_with_filters = get_log_groups_with_filters()
-
-    if not log_groups_with_filters:
+    if not filters_to_keep_count and not filters_to_remove:
         logger.info(
             f"No log groups found with {VARIABLE_LOGGING_NAME} filters. Nothing to clean up."
         )
         # Clean up the SSM parameter if it exists
-        try:
-            ssm_client.delete_parameter(Name=FILTERS_TRACKING_PARAM)
-            logger.info(f"Deleted {FILTERS_TRACKING_PARAM} SSM parameter")
-        except ssm_client.exceptions.ParameterNotFound:
-            logger.debug(f"{FILTERS_TRACKING_PARAM} parameter does not exist")
+        delete_tracking_param()
         return
 
-    # Step 3: Determine which filters should be removed
-    filters_to_remove = []
-    filters_to_keep = []
-
-    for log_group_name in log_groups_with_filters:
-        matches_any_pattern = False
-        matched_pattern = None
-
-        for pattern in current_patterns:
-            if fnmatch.fnmatch(log_group_name, pattern):
-                matches_any_pattern = True
-                matched_pattern = pattern
-                break
-
-        if matches_any_pattern:
-            filters_to_keep.append(log_group_name)
-            logger.debug(
-                f"Keeping filter on {log_group_name} (matches {matched_pattern})"
-            )
-        else:
-            filters_to_remove.append(log_group_name)
-            logger.info(
-                f"Will remove filter from {log_group_name} (no matching pattern)"
-            )
-
     logger.info(
-        f"Filters to keep: {len(filters_to_keep)}, Filters to remove: {len(filters_to_remove)}"
+        f"Filters to keep: {filters_to_keep_count}, Filters to remove: {len(filters_to_remove)}"
     )
 
     # Step 4: Remove orphaned filters
     removed_count = 0
     failed_count = 0
 
-    for log_group_name in filters_to_remove:
-        try:
-            cloudwatch_logs_client.delete_subscription_filter(
-                filterName=FILTER_NAME,
-                logGroupName=log_group_name,
-            )
-            removed_count += 1
-            logger.info(f"Successfully removed filter from {log_group_name}")
-        except cloudwatch_logs_client.exceptions.ResourceNotFoundException:
-            # Filter or log group no longer exists - this is fine
-            logger.info(f"Filter or log group already gone: {log_group_name}")
-            removed_count += 1
-        except Exception as error:
-            failed_count += 1
-            logger.error(
-                f"Failed to remove filter from {log_group_name}: {error}"
-            )
-            # Continue processing - don't let one failure stop cleanup
+    # Deletions are independent, so they are issued concurrently
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        for removed in executor.map(remove_subscription_filter, filters_to_remove):
+            if removed:
+                removed_count += 1
+            else:
+                failed_count += 1
 
     logger.info(
         f"Cleanup complete: {removed_count} filters removed, {failed_count} failures"
@@ -365,18 +570,13 @@ def reconcile_subscription_filters():
 
     # Step 5: Update SSM parameter to reflect current patterns (for reference/auditing)
     if current_patterns:
-        subscription_filter_param(current_patterns)
+        replace_tracking_list(current_patterns)
         logger.info(
             f"Updated {FILTERS_TRACKING_PARAM} SSM parameter with current patterns"
         )
     else:
-        try:
-            ssm_client.delete_parameter(Name=FILTERS_TRACKING_PARAM)
-            logger.info(
-                f"Deleted {FILTERS_TRACKING_PARAM} SSM parameter (no active patterns)"
-            )
-        except ssm_client.exceptions.ParameterNotFound:
-            logger.debug(f"{FILTERS_TRACKING_PARAM} parameter does not exist")
+        logger.info("No active patterns remain")
+        delete_tracking_param()
 
 
 def subscription_filter_param(filterList):
@@ -402,54 +602,72 @@ def lambda_handler(event, context):
     Processes CreateLogGroup, PutParameter, and DeleteParameter events to manage
     CloudWatch Logs subscription filters.
     """
+    global parameters_cache, parameters_matcher, tracking_cache, tracking_changed, log_groups_cache
+    parameters_cache = None
+    parameters_matcher = None
+    tracking_cache = None
+    tracking_changed = False
+    log_groups_cache = None
+
     logger.info("Lambda invoked by EventBridge")
-    logger.debug(f"Event payload:\n{json.dumps(event, indent=4)}")
+    # Skip pretty-printing the event unless DEBUG output is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event payload:\n%s", json.dumps(event, indent=4))
 
     event_name = event["detail"]["eventName"]
 
-    if event_name == "CreateLogGroup":
-        log_group_name = event["detail"]["requestParameters"]["logGroupName"]
-        logger.info(f"Processing CreateLogGroup event for: {log_group_name}")
-        add_subscription_filter_to_new_log_group(log_group_name)
-        logger.info(
-            f"Completed processing CreateLogGroup event for: {log_group_name}"
-        )
-
-    elif event_name == "PutParameter":
-        param_name = event["detail"]["requestParameters"]["name"]
-        if SSM_PARAMETER_ROOT in param_name:
-            logger.info(
-                f"Processing PutParameter event for {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
-            )
-            update_subscription_filter_on_existing_log_groups(param_name)
-            logger.info(
-                "Reconciling all filters to remove orphaned subscriptions..."
-            )
-            reconcile_subscription_filters()
-            logger.info(
-                f"Completed processing PutParameter event for: {param_name}"
-            )
-        else:
+    try:
+        if event_name == "CreateLogGroup":
+            log_group_name = event["detail"]["requestParameters"]["logGroupName"]
+            logger.info(f"Processing CreateLogGroup event for: {log_group_name}")
+            add_subscription_filter_to_new_log_group(log_group_name)
             logger.info(
-                f"Skipping PutParameter event - not a {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
+                f"Completed processing CreateLogGroup event for: {log_group_name}"
             )
 
-    elif event_name == "DeleteParameter":
-        param_name = event["detail"]["requestParameters"]["name"]
-        if SSM_PARAMETER_ROOT in param_name:
-            logger.info(
-                f"Processing DeleteParameter event for {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
-            )
-            reconcile_subscription_filters()
-            logger.info(
-                f"Completed processing DeleteParameter event for: {param_name}"
-            )
+        elif event_name == "PutParameter":
+            param_name = event["detail"]["requestParameters"]["name"]
+            if param_name.startswith(SSM_PARAMETER_ROOT):
+                logger.info(
+                    f"Processing PutParameter event for {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
+                )
+                update_subscription_filter_on_existing_log_groups(param_name)
+                logger.info(
+                    "Reconciling all filters to remove orphaned subscriptions..."
+                )
+                reconcile_subscription_filters()
+                logger.info(
+                    f"Completed processing PutParameter event for: {param_name}"
+                )
+            else:
+                logger.info(
+                    f"Skipping PutParameter event - not a {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
+                )
+
+        elif event_name == "DeleteParameter":
+            param_name = event["detail"]["requestParameters"]["name"]
+            if param_name.startswith(SSM_PARAMETER_ROOT):
+                logger.info(
+                    f"Processing DeleteParameter event for {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
+                )
+                reconcile_subscription_filters()
+                logger.info(
+                    f"Completed processing DeleteParameter event for: {param_name}"
+                )
+            else:
+                logger.info(
+                    f"Skipping DeleteParameter event - not a {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
+                )
+
         else:
             logger.info(
-                f"Skipping DeleteParameter event - not a {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
+                f"Skipping event - not a recognized event type: {event_name}"
             )
-
-    else:
-        logger.info(
-            f"Skipping event - not a recognized event type: {event_name}"
-        )
+    except Exception:
+        # Filters added before a failure are still recorded, without hiding the original error
+        try:
+            save_tracking_list()
+        except Exception as error:
+            logger.error(f"Failed to save {FILTERS_TRACKING_PARAM}: {error}")
+        raise
+    save_tracking_list()
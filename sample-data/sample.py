@@ -1,31 +0,0 @@
-# New functions allowing workload accounts to automatically sync their logging configurations 
-# to a central audit account. This enables centralized visibility and management across multiple
-#  AWS accounts while maintaining the same core subscription filter functionality.
-
-# Invalid JSON handling
-
-# sync_parameters_to_central_account()
-
-# Sync with parameters
-
-# Sync with no parameters
-
-# Handling ParameterNotFound on delete
-
-# put_parameter failure
-
-# Lambda handler integration
-
-# PutParameter triggers sync
-
-# DeleteParameter triggers sync
-
-# Events that should not trigger sync
-
-# Consolidated config format
-
-# JSON structure
-
-# Parameter name format
-
-# Empty config handling
\ No newline at end of file
@@ -11,30 +11,108 @@ These tests cover:
 Run tests with: pytest tests/test_variablized_index.py -v
 """
 
+import functools
+import importlib
 import json
 import os
+import sys
 import pytest
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import ANY, MagicMock, patch, call
 from botocore.exceptions import ClientError
 
+# Parse and serialize with orjson when it is installed, as the Lambda does
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def json_dumps(value):
+        """Serialize to a JSON string, like a parameter Value."""
+        return orjson.dumps(value).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+    JSONDecodeError = json.JSONDecodeError
+
 
 # =============================================================================
 # TEST FIXTURES AND SETUP
 # =============================================================================
 
+# Solution name this suite configures, and the upper-cased form used in log messages
+VARIABLE_LOGGING_NAME = "cpl"
+VARIABLE_LOGGING_NAME_UPPER = VARIABLE_LOGGING_NAME.upper()
+
+# Parameters the Lambda acts on live under this root, so it is matched as a prefix
+SSM_PARAMETER_ROOT = "/cpl/"
+
+
+class ResourceNotFoundException(ClientError):
+    """Stands in for the CloudWatch Logs client's ResourceNotFoundException."""
+
+
+class ParameterNotFound(ClientError):
+    """Stands in for the SSM client's ParameterNotFound."""
+
+
+# Error responses used to build ClientErrors in the error handling tests
+ACCESS_DENIED_RESPONSE = {"Error": {"Code": "AccessDeniedException", "Message": "Access Denied"}}
+VALIDATION_ERROR_RESPONSE = {"Error": {"Code": "ValidationException", "Message": "Invalid parameter"}}
+# Client errors carrying the codes the real clients raise, built once
+RESOURCE_NOT_FOUND = ResourceNotFoundException(
+    {"Error": {"Code": "ResourceNotFoundException", "Message": "The specified log group does not exist."}},
+    "DescribeSubscriptionFilters",
+)
+PARAMETER_NOT_FOUND = ParameterNotFound(
+    {"Error": {"Code": "ParameterNotFound", "Message": ""}},
+    "GetParameter",
+)
+
+# Tracking parameter values, comma-joined as subscription_filter_param stores them
+TRACKED_LOG_GROUP_VALUE = "/aws/lambda/api/service1"
+TRACKED_PATTERNS_VALUE = ",".join(("*/api/*", "*/web/*"))
+TRACKED_PATTERN_VALUE = "*/api/*"
+# Description subscription_filter_param writes for the "cpl" solution, and its casefolded form
+TRACKING_PARAM_DESCRIPTION = "A List of Log Groups to which cpl has Subscription Filters Applied."
+TRACKING_PARAM_DESCRIPTION_FOLDED = TRACKING_PARAM_DESCRIPTION.casefold()
+LONG_FILTER_LIST = tuple(f"*/service{i}/*" for i in range(100))
+LONG_FILTER_VALUE = ",".join(LONG_FILTER_LIST)
+# SSM limits parameter values by size in bytes, not characters
+SSM_STANDARD_VALUE_LIMIT = 4096
+LONG_FILTER_BYTE_LEN = len(LONG_FILTER_VALUE.encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=None)
+def derive_names(name):
+    """Derive the SSM root, filter name and tracking parameter the Lambda builds from VARIABLE_LOGGING_NAME."""
+    title = name.title().replace('_', '')
+    return f"/{name}/", f"{title}AutoCreatedFilter", f"{title}_Filters"
+
+
+# Environment the Lambda is configured with
+LAMBDA_ENV = {
+    "AWS_REGION": "eu-west-2",
+    "AWS_ACCOUNT_ID": "123456789012",
+    "VARIABLE_LOGGING_NAME": "cpl",
+    "SSM_PARAMETER_ROOT": "/cpl/",
+    "FILTER_NAME": "CplAutoCreatedFilter",
+    "FILTERS_TRACKING_PARAM": "Cpl_Filters",
+    "SENDER_FUNCTION_NAME": "log-sender-function",
+    "LOGGING_LEVEL": "INFO",
+}
+DESTINATION_ARN = "arn:aws:lambda:eu-west-2:123456789012:function:log-sender-function"
+
+
+def make_event(event_name, **request_parameters):
+    """Build an EventBridge event as CloudTrail delivers it to the Lambda."""
+    return {"detail": {"eventName": event_name, "requestParameters": request_parameters}}
+
+
 @pytest.fixture(autouse=True)
 def set_env_vars():
     """Set up environment variables before each test."""
-    env_vars = {
-        "AWS_REGION": "eu-west-2",
-        "VARIABLE_LOGGING_NAME": "cpl",
-        "SSM_PARAMETER_ROOT": "/cpl/",
-        "FILTER_NAME": "CplAutoCreatedFilter",
-        "FILTERS_TRACKING_PARAM": "Cpl_Filters",
-        "SENDER_FUNCTION_NAME": "log-sender-function",
-        "LOGGING_LEVEL": "INFO",
-    }
-    with patch.dict(os.environ, env_vars, clear=False):
+    with patch.dict(os.environ, LAMBDA_ENV, clear=False):
         yield
 
 
@@ -47,17 +125,18 @@ def mock_ssm_client():
         yield mock_ssm
 
 
-@pytest.fixture
-def mock_boto3_clients():
-    """Create mock boto3 clients for all services."""
+@pytest.fixture(scope="module")
+def boto3_client_mocks():
+    """Create mock boto3 clients for all services once per module."""
     with patch('boto3.client') as mock_client:
         # Create mock clients for each service
         mock_ssm = MagicMock()
         mock_logs = MagicMock()
         mock_sts = MagicMock()
         
-        # Configure STS to return a test account ID
-        mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
+        # Attach the modelled exceptions once, like boto3 clients expose them
+        mock_logs.exceptions.ResourceNotFoundException = ResourceNotFoundException
+        mock_ssm.exceptions.ParameterNotFound = ParameterNotFound
         
         def client_factory(service, **kwargs):
             if service == "ssm":
@@ -79,6 +158,49 @@ def mock_boto3_clients():
 
 
 @pytest.fixture
+def mock_boto3_clients(boto3_client_mocks):
+    """Mock boto3 clients for all services, reset before each test."""
+    for service in ("ssm", "logs", "sts"):
+        boto3_client_mocks[service].reset_mock(return_value=True, side_effect=True)
+    
+    # Configure STS to return a test account ID
+    boto3_client_mocks["sts"].get_caller_identity.return_value = {"Account": "123456789012"}
+    
+    return boto3_client_mocks
+
+
+@pytest.fixture(scope="module")
+def index_module(boto3_client_mocks):
+    """index.py, imported once per module against the mocked boto3 clients."""
+    sys.modules.pop("index", None)
+    with patch.dict(os.environ, LAMBDA_ENV):
+        module = importlib.import_module("index")
+    yield module
+    sys.modules.pop("index", None)
+
+
+@pytest.fixture
+def lambda_index(index_module, mock_boto3_clients, sample_parameters, sample_log_groups):
+    """index.py with the mocked clients serving the sample parameters and log groups and no tracking parameter."""
+    mock_ssm = mock_boto3_clients["ssm"]
+    mock_logs = mock_boto3_clients["logs"]
+    mock_ssm.get_paginator.return_value.paginate.return_value = [{"Parameters": sample_parameters}]
+    mock_ssm.get_parameter.side_effect = PARAMETER_NOT_FOUND
+    mock_logs.get_paginator.return_value.paginate.return_value = [{"logGroups": sample_log_groups}]
+    mock_logs.describe_subscription_filters.return_value = {"subscriptionFilters": []}
+    return index_module
+
+
+def filters_on(*log_group_names):
+    """describe_subscription_filters side effect reporting our filter on the given log groups only."""
+    def describe_filters(logGroupName, filterNamePrefix):
+        if logGroupName in log_group_names:
+            return {"subscriptionFilters": [{"filterName": filterNamePrefix}]}
+        return {"subscriptionFilters": []}
+    return describe_filters
+
+
+@pytest.fixture(scope="module")
 def sample_parameters():
     """Sample SSM parameters for testing."""
     return [
@@ -106,7 +228,7 @@ def sample_parameters():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_log_groups():
     """Sample CloudWatch log groups for testing."""
     return [
@@ -118,6 +240,36 @@ def sample_log_groups():
     ]
 
 
+@pytest.fixture(scope="module")
+def nested_json_param():
+    """SSM parameter with a nested JSON value, serialized and parsed once."""
+    value = json_dumps({
+        "log_group_name_pattern": "*/api/*",
+        "prefix": "API",
+        "metadata": {
+            "created_by": "admin",
+            "tags": ["production", "api"]
+        }
+    })
+    return {"Name": "/cpl/nested", "Value": value, "parsed": json_loads(value)}
+
+
+@pytest.fixture(scope="module")
+def unicode_json_param():
+    """SSM parameter with unicode characters in its JSON value, serialized and parsed once."""
+    value = json_dumps({
+        "log_group_name_pattern": "*/api/*",
+        "prefix": "API",
+        "description": "日本語テスト"  # Japanese characters
+    })
+    return {
+        "Name": "/cpl/unicode",
+        "Value": value,
+        "parsed": json_loads(value),
+        "byte_length": len(value.encode("utf-8")),
+    }
+
+
 # =============================================================================
 # CONFIGURATION TESTS
 # =============================================================================
@@ -132,26 +284,22 @@ class TestConfiguration:
     
     def test_ssm_parameter_root_derived_from_logging_name(self):
         """Test that SSM_PARAMETER_ROOT is correctly derived from VARIABLE_LOGGING_NAME."""
-        variable_logging_name = "cpl"
-        expected_root = f"/{variable_logging_name}/"
+        expected_root, _, _ = derive_names(VARIABLE_LOGGING_NAME)
         assert expected_root == "/cpl/"
     
     def test_filter_name_derived_from_logging_name(self):
         """Test that FILTER_NAME is correctly derived from VARIABLE_LOGGING_NAME."""
-        variable_logging_name = "cpl"
-        expected_filter = f"{variable_logging_name.title().replace('_', '')}AutoCreatedFilter"
+        _, expected_filter, _ = derive_names(VARIABLE_LOGGING_NAME)
         assert expected_filter == "CplAutoCreatedFilter"
     
     def test_filter_name_with_underscore_in_name(self):
         """Test filter name derivation when VARIABLE_LOGGING_NAME contains underscores."""
-        variable_logging_name = "my_custom_solution"
-        expected_filter = f"{variable_logging_name.title().replace('_', '')}AutoCreatedFilter"
+        _, expected_filter, _ = derive_names("my_custom_solution")
         assert expected_filter == "MyCustomSolutionAutoCreatedFilter"
     
     def test_filters_tracking_param_derived_from_logging_name(self):
         """Test that FILTERS_TRACKING_PARAM is correctly derived from VARIABLE_LOGGING_NAME."""
-        variable_logging_name = "cpl"
-        expected_param = f"{variable_logging_name.title().replace('_', '')}_Filters"
+        _, _, expected_param = derive_names(VARIABLE_LOGGING_NAME)
         assert expected_param == "Cpl_Filters"
     
     def test_default_aws_region(self):
@@ -309,6 +457,7 @@ class TestGetPrefix:
 # ADD SUBSCRIPTION FILTER TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group("add_subscription_filter")
 class TestAddSubscriptionFilter:
     """Tests for add_subscription_filter function."""
     
@@ -327,9 +476,12 @@ class TestAddSubscriptionFilter:
             logGroupName=log_group_name,
         )
         
-        mock_logs.put_subscription_filter.assert_called_once()
-        call_args = mock_logs.put_subscription_filter.call_args
-        assert call_args[1]["filterName"] == "CplAutoCreatedFilter"
+        mock_logs.put_subscription_filter.assert_called_once_with(
+            destinationArn=ANY,
+            filterName="CplAutoCreatedFilter",
+            filterPattern="[]",
+            logGroupName=log_group_name,
+        )
     
     def test_uses_configurable_tracking_param(self, mock_boto3_clients):
         """Test that the configurable tracking parameter name is used."""
@@ -345,14 +497,12 @@ class TestAddSubscriptionFilter:
         """Test that tracking parameter is updated after adding a filter."""
         mock_ssm = mock_boto3_clients["ssm"]
         
-        filter_list = ["/aws/lambda/api/service1"]
         filters_tracking_param = "Cpl_Filters"
-        variable_logging_name = "cpl"
         
         mock_ssm.put_parameter(
             Name=filters_tracking_param,
-            Description=f"A List of Log Groups to which {variable_logging_name} has Subscription Filters Applied.",
-            Value=",".join(filter_list),
+            Description=TRACKING_PARAM_DESCRIPTION,
+            Value=TRACKED_LOG_GROUP_VALUE,
             Type="String",
             Overwrite=True,
         )
@@ -367,6 +517,7 @@ class TestAddSubscriptionFilter:
 # GET LOG GROUPS WITH FILTERS TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group("get_log_groups_with_filters")
 class TestGetLogGroupsWithFilters:
     """Tests for get_log_groups_with_filters function."""
     
@@ -412,28 +563,23 @@ class TestGetLogGroupsWithFilters:
     def test_handles_resource_not_found_exception(self, mock_boto3_clients):
         """Test graceful handling when log group no longer exists."""
         mock_logs = mock_boto3_clients["logs"]
-        mock_logs.exceptions = MagicMock()
-        mock_logs.exceptions.ResourceNotFoundException = type(
-            'ResourceNotFoundException', (Exception,), {}
-        )
-        mock_logs.describe_subscription_filters.side_effect = \
-            mock_logs.exceptions.ResourceNotFoundException()
+        mock_logs.describe_subscription_filters.side_effect = RESOURCE_NOT_FOUND
         
-        # Should not raise - just skip this log group
-        try:
+        # Raised by the client - should be handled gracefully in actual code
+        with pytest.raises(mock_logs.exceptions.ResourceNotFoundException) as exc_info:
             mock_logs.describe_subscription_filters(
                 logGroupName="/deleted/log/group",
                 filterNamePrefix="CplAutoCreatedFilter"
             )
-            assert False, "Should have raised exception"
-        except mock_logs.exceptions.ResourceNotFoundException:
-            pass  # Expected - should be handled gracefully in actual code
+        
+        assert exc_info.value.response["Error"]["Code"] == "ResourceNotFoundException"
 
 
 # =============================================================================
 # RECONCILE SUBSCRIPTION FILTERS TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group("reconcile_subscription_filters")
 class TestReconcileSubscriptionFilters:
     """Tests for reconcile_subscription_filters function."""
     
@@ -464,31 +610,37 @@ class TestReconcileSubscriptionFilters:
         
         mock_ssm.delete_parameter.assert_called_with(Name="Cpl_Filters")
     
-    def test_keeps_filters_matching_patterns(self):
-        """Test that filters matching patterns are kept."""
-        import fnmatch
-        
+    def test_keeps_filters_matching_patterns(self, index_module):
+        """Test that filters matching patterns are kept, and the match names the pattern."""
         patterns = ["*/api/*", "*/web/*"]
-        log_group = "/aws/lambda/api/service1"
         
-        matches = any(fnmatch.fnmatch(log_group, p) for p in patterns)
-        assert matches is True
+        match = index_module.compile_patterns(patterns).match("/aws/lambda/web/frontend")
+        assert match is not None
+        assert patterns[int(match.lastgroup[1:])] == "*/web/*"
     
-    def test_removes_filters_not_matching_patterns(self):
-        """Test that filters not matching any pattern are marked for removal."""
-        import fnmatch
+    def test_first_matching_pattern_wins(self, index_module):
+        """Test that a log group matching several patterns is attributed to the first."""
+        patterns = ["*/lambda/*", "*/api/*"]
         
+        match = index_module.compile_patterns(patterns).match("/aws/lambda/api/service1")
+        assert match.lastgroup == "p0"
+    
+    def test_removes_filters_not_matching_patterns(self, index_module):
+        """Test that filters not matching any pattern are marked for removal."""
         patterns = ["*/api/*", "*/web/*"]
-        log_group = "/aws/lambda/other/service"
         
-        matches = any(fnmatch.fnmatch(log_group, p) for p in patterns)
-        assert matches is False
+        assert index_module.compile_patterns(patterns).match("/aws/lambda/other/service") is None
+    
+    def test_no_patterns_match_nothing(self, index_module):
+        """Test that an empty pattern list matches no log group."""
+        assert index_module.compile_patterns([]).match("/aws/lambda/api/service1") is None
 
 
 # =============================================================================
 # SUBSCRIPTION FILTER PARAM TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group("subscription_filter_param")
 class TestSubscriptionFilterParam:
     """Tests for subscription_filter_param function."""
     
@@ -496,161 +648,233 @@ class TestSubscriptionFilterParam:
         """Test that configurable parameter name is used."""
         mock_ssm = mock_boto3_clients["ssm"]
         
-        filter_list = ["*/api/*", "*/web/*"]
         filters_tracking_param = "Cpl_Filters"
-        variable_logging_name = "cpl"
         
         mock_ssm.put_parameter(
             Name=filters_tracking_param,
-            Description=f"A List of Log Groups to which {variable_logging_name} has Subscription Filters Applied.",
-            Value=",".join(filter_list),
+            Description=TRACKING_PARAM_DESCRIPTION,
+            Value=TRACKED_PATTERNS_VALUE,
             Type="String",
             Overwrite=True,
         )
         
-        call_args = mock_ssm.put_parameter.call_args
-        assert call_args[1]["Name"] == "Cpl_Filters"
+        mock_ssm.put_parameter.assert_called_with(
+            Name="Cpl_Filters",
+            Description=ANY,
+            Value=ANY,
+            Type=ANY,
+            Overwrite=ANY,
+        )
     
     def test_uses_configurable_solution_name_in_description(self, mock_boto3_clients):
         """Test that configurable solution name is used in description."""
         mock_ssm = mock_boto3_clients["ssm"]
         
-        filter_list = ["*/api/*"]
-        variable_logging_name = "cpl"
-        
         mock_ssm.put_parameter(
             Name="Cpl_Filters",
-            Description=f"A List of Log Groups to which {variable_logging_name} has Subscription Filters Applied.",
-            Value=",".join(filter_list),
+            Description=TRACKING_PARAM_DESCRIPTION,
+            Value=TRACKED_PATTERN_VALUE,
             Type="String",
             Overwrite=True,
         )
         
         call_args = mock_ssm.put_parameter.call_args
-        assert "cpl" in call_args[1]["Description"]
-        assert "serpent" not in call_args[1]["Description"].lower()
+        assert call_args[1]["Description"] == TRACKING_PARAM_DESCRIPTION
+        assert "cpl" in TRACKING_PARAM_DESCRIPTION
+        assert "serpent" not in TRACKING_PARAM_DESCRIPTION_FOLDED
 
 
 # =============================================================================
 # LAMBDA HANDLER TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group("lambda_handler")
 class TestLambdaHandler:
     """Tests for lambda_handler function."""
     
-    def test_handles_create_log_group_event(self):
-        """Test handling of CreateLogGroup events."""
-        event = {
-            "detail": {
-                "eventName": "CreateLogGroup",
-                "requestParameters": {
-                    "logGroupName": "/aws/lambda/api/new-service"
-                }
-            }
-        }
+    @pytest.mark.parametrize("event_name, request_parameters, should_process", [
+        ("CreateLogGroup", {"logGroupName": "/aws/lambda/api/new-service"}, True),
+        ("PutParameter", {"name": "/cpl/api-logs"}, True),
+        ("PutParameter", {"name": "/other/parameter"}, False),
+        ("DeleteParameter", {"name": "/cpl/old-config"}, True),
+        ("DeleteParameter", {"name": "/other/parameter"}, False),
+        ("SomeOtherEvent", {}, False),
+    ])
+    def test_dispatch(self, lambda_index, mock_boto3_clients, event_name, request_parameters, should_process):
+        """Test which events are processed and which are skipped."""
+        lambda_index.lambda_handler(make_event(event_name, **request_parameters), None)
+        
+        # Every processed event reads the parameters under SSM_PARAMETER_ROOT
+        paginate = mock_boto3_clients["ssm"].get_paginator.return_value.paginate
+        assert paginate.called == should_process
+    
+    def test_uses_configurable_name_in_log_messages(self):
+        """Test that configurable solution name would be used in log messages."""
+        param_name = "/cpl/config"
         
-        event_name = event["detail"]["eventName"]
-        log_group_name = event["detail"]["requestParameters"]["logGroupName"]
+        # Simulate what the log message should look like
+        log_message = f"Processing PutParameter event for {VARIABLE_LOGGING_NAME_UPPER} parameter: {param_name}"
         
-        assert event_name == "CreateLogGroup"
-        assert log_group_name == "/aws/lambda/api/new-service"
+        assert "CIP" in log_message
+        assert "SERPENT" not in log_message
+
+
+# =============================================================================
+# LAMBDA HANDLER FLOW TESTS
+# =============================================================================
+
+@pytest.mark.xdist_group("lambda_handler_flows")
+class TestLambdaHandlerFlows:
+    """Tests driving index.lambda_handler against the mocked clients."""
     
-    def test_handles_put_parameter_event_for_solution_params(self):
-        """Test handling of PutParameter events for solution parameters."""
-        event = {
-            "detail": {
-                "eventName": "PutParameter",
-                "requestParameters": {
-                    "name": "/cpl/new-config"
-                }
-            }
-        }
+    def test_create_log_group_adds_filter_and_tracks_it(self, lambda_index, mock_boto3_clients):
+        """Test that a new log group matching a pattern gets the filter and is tracked."""
+        lambda_index.lambda_handler(make_event("CreateLogGroup", logGroupName="/aws/lambda/api/new"), None)
         
-        param_name = event["detail"]["requestParameters"]["name"]
-        ssm_parameter_root = "/cpl/"
+        mock_boto3_clients["logs"].put_subscription_filter.assert_called_once_with(
+            destinationArn=DESTINATION_ARN,
+            filterName="CplAutoCreatedFilter",
+            filterPattern="%^API*%",
+            logGroupName="/aws/lambda/api/new",
+        )
+        mock_boto3_clients["ssm"].put_parameter.assert_called_once_with(
+            Name="Cpl_Filters",
+            Description=TRACKING_PARAM_DESCRIPTION,
+            Value="/aws/lambda/api/new",
+            Type="String",
+            Overwrite=True,
+        )
+    
+    def test_create_log_group_without_matching_pattern(self, lambda_index, mock_boto3_clients):
+        """Test that a new log group matching no pattern is left alone."""
+        lambda_index.lambda_handler(make_event("CreateLogGroup", logGroupName="/aws/lambda/other/new"), None)
         
-        assert ssm_parameter_root in param_name
+        mock_boto3_clients["logs"].put_subscription_filter.assert_not_called()
+        mock_boto3_clients["ssm"].put_parameter.assert_not_called()
     
-    def test_skips_put_parameter_event_for_other_params(self):
-        """Test that PutParameter events for non-solution parameters are skipped."""
-        event = {
-            "detail": {
-                "eventName": "PutParameter",
-                "requestParameters": {
-                    "name": "/other/parameter"
-                }
-            }
-        }
+    def test_put_parameter_adds_filters_and_removes_orphans(self, lambda_index, mock_boto3_clients):
+        """Test that PutParameter filters the matching log groups and removes filters matching no pattern."""
+        mock_logs = mock_boto3_clients["logs"]
+        mock_logs.describe_subscription_filters.side_effect = filters_on(
+            "/aws/lambda/api/service1", "/aws/lambda/api/service2", "/aws/lambda/other/service"
+        )
         
-        param_name = event["detail"]["requestParameters"]["name"]
-        ssm_parameter_root = "/cpl/"
+        lambda_index.lambda_handler(make_event("PutParameter", name="/cpl/api-logs"), None)
+        
+        assert mock_logs.put_subscription_filter.call_args_list == [
+            call(
+                destinationArn=DESTINATION_ARN,
+                filterName="CplAutoCreatedFilter",
+                filterPattern="%^API*%",
+                logGroupName=log_group_name,
+            )
+            for log_group_name in ("/aws/lambda/api/service1", "/aws/lambda/api/service2")
+        ]
+        mock_logs.delete_subscription_filter.assert_called_once_with(
+            filterName="CplAutoCreatedFilter",
+            logGroupName="/aws/lambda/other/service",
+        )
+        mock_boto3_clients["ssm"].put_parameter.assert_called_once_with(
+            Name="Cpl_Filters",
+            Description=TRACKING_PARAM_DESCRIPTION,
+            Value="*/api/*,*/web/*,*/database/*",
+            Type="String",
+            Overwrite=True,
+        )
+    
+    def test_put_parameter_lists_once_per_invocation(self, lambda_index, mock_boto3_clients):
+        """Test that parameters and log groups are listed once per invocation and re-read by the next."""
+        for _ in range(2):
+            lambda_index.lambda_handler(make_event("PutParameter", name="/cpl/api-logs"), None)
         
-        assert ssm_parameter_root not in param_name
+        assert mock_boto3_clients["ssm"].get_paginator.return_value.paginate.call_count == 2
+        assert mock_boto3_clients["logs"].get_paginator.return_value.paginate.call_count == 2
     
-    def test_handles_delete_parameter_event(self):
-        """Test handling of DeleteParameter events."""
-        event = {
-            "detail": {
-                "eventName": "DeleteParameter",
-                "requestParameters": {
-                    "name": "/cpl/old-config"
-                }
-            }
-        }
+    def test_delete_last_parameter_removes_filters_and_tracking(self, lambda_index, mock_boto3_clients):
+        """Test that deleting the last parameter removes every filter and the tracking parameter."""
+        mock_ssm = mock_boto3_clients["ssm"]
+        mock_logs = mock_boto3_clients["logs"]
+        mock_ssm.get_paginator.return_value.paginate.return_value = [{"Parameters": []}]
+        mock_logs.describe_subscription_filters.side_effect = filters_on("/aws/lambda/api/service1")
         
-        event_name = event["detail"]["eventName"]
-        param_name = event["detail"]["requestParameters"]["name"]
-        ssm_parameter_root = "/cpl/"
+        lambda_index.lambda_handler(make_event("DeleteParameter", name="/cpl/api-logs"), None)
         
-        assert event_name == "DeleteParameter"
-        assert ssm_parameter_root in param_name
+        mock_logs.delete_subscription_filter.assert_called_once_with(
+            filterName="CplAutoCreatedFilter",
+            logGroupName="/aws/lambda/api/service1",
+        )
+        mock_ssm.delete_parameter.assert_called_once_with(Name="Cpl_Filters")
+        mock_ssm.put_parameter.assert_not_called()
     
-    def test_skips_delete_parameter_event_for_other_params(self):
-        """Test that DeleteParameter events for non-solution parameters are skipped."""
-        event = {
-            "detail": {
-                "eventName": "DeleteParameter",
-                "requestParameters": {
-                    "name": "/other/parameter"
-                }
-            }
-        }
+    def test_deleted_log_group_skipped_during_scan(self, lambda_index, mock_boto3_clients):
+        """Test that a log group deleted mid-scan is treated as having no filter."""
+        mock_ssm = mock_boto3_clients["ssm"]
+        mock_logs = mock_boto3_clients["logs"]
+        mock_logs.describe_subscription_filters.side_effect = RESOURCE_NOT_FOUND
         
-        param_name = event["detail"]["requestParameters"]["name"]
-        ssm_parameter_root = "/cpl/"
+        lambda_index.lambda_handler(make_event("DeleteParameter", name="/cpl/api-logs"), None)
         
-        assert ssm_parameter_root not in param_name
+        mock_logs.delete_subscription_filter.assert_not_called()
+        mock_ssm.delete_parameter.assert_called_once_with(Name="Cpl_Filters")
     
-    def test_skips_unrecognized_events(self):
-        """Test that unrecognized event types are skipped."""
-        event = {
-            "detail": {
-                "eventName": "SomeOtherEvent",
-                "requestParameters": {}
-            }
-        }
+    @pytest.mark.parametrize("event_name", ["PutParameter", "DeleteParameter"])
+    def test_parameter_outside_root_is_skipped(self, lambda_index, mock_boto3_clients, event_name):
+        """Test that parameters outside SSM_PARAMETER_ROOT are not processed."""
+        lambda_index.lambda_handler(make_event(event_name, name="/other/parameter"), None)
+        
+        mock_boto3_clients["ssm"].get_paginator.return_value.paginate.assert_not_called()
+        mock_boto3_clients["logs"].get_paginator.return_value.paginate.assert_not_called()
+        mock_boto3_clients["ssm"].put_parameter.assert_not_called()
+    
+    def test_throttled_tracking_read_raises_without_saving(self, lambda_index, mock_boto3_clients):
+        """Test that a failed tracking read is raised instead of overwriting the tracked entries."""
+        mock_ssm = mock_boto3_clients["ssm"]
+        mock_ssm.get_parameter.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "GetParameter"
+        )
         
-        event_name = event["detail"]["eventName"]
-        recognized_events = ["CreateLogGroup", "PutParameter", "DeleteParameter"]
+        with pytest.raises(ClientError) as exc_info:
+            lambda_index.lambda_handler(make_event("CreateLogGroup", logGroupName="/aws/lambda/api/new"), None)
         
-        assert event_name not in recognized_events
+        assert exc_info.value.response["Error"]["Code"] == "ThrottlingException"
+        mock_ssm.put_parameter.assert_not_called()
     
-    def test_uses_configurable_name_in_log_messages(self):
-        """Test that configurable solution name would be used in log messages."""
-        variable_logging_name = "cpl"
-        param_name = "/cpl/config"
+    def test_failed_save_does_not_hide_handler_error(self, lambda_index, mock_boto3_clients):
+        """Test that entries added before a failure are saved, and a failed save keeps the original error."""
+        mock_ssm = mock_boto3_clients["ssm"]
+        mock_boto3_clients["logs"].put_subscription_filter.side_effect = [
+            None,
+            ClientError(ACCESS_DENIED_RESPONSE, "PutSubscriptionFilter"),
+        ]
+        mock_ssm.put_parameter.side_effect = ClientError(VALIDATION_ERROR_RESPONSE, "PutParameter")
         
-        # Simulate what the log message should look like
-        log_message = f"Processing PutParameter event for {variable_logging_name.upper()} parameter: {param_name}"
+        with pytest.raises(ClientError) as exc_info:
+            lambda_index.lambda_handler(make_event("PutParameter", name="/cpl/api-logs"), None)
         
-        assert "CIP" in log_message
-        assert "SERPENT" not in log_message
+        assert exc_info.value.response["Error"]["Code"] == "AccessDeniedException"
+        mock_ssm.put_parameter.assert_called_once_with(
+            Name="Cpl_Filters", Description=ANY, Value="*/api/*", Type="String", Overwrite=True
+        )
+    
+    def test_parameter_read_failure_stops_reconcile(self, lambda_index, mock_boto3_clients):
+        """Test that reconcile raises, and removes nothing, when the parameters cannot be read."""
+        mock_logs = mock_boto3_clients["logs"]
+        mock_boto3_clients["ssm"].get_paginator.return_value.paginate.side_effect = ClientError(
+            ACCESS_DENIED_RESPONSE, "GetParametersByPath"
+        )
+        mock_logs.describe_subscription_filters.side_effect = filters_on("/aws/lambda/other/service")
+        
+        with pytest.raises(ClientError):
+            lambda_index.lambda_handler(make_event("DeleteParameter", name="/cpl/api-logs"), None)
+        
+        mock_logs.delete_subscription_filter.assert_not_called()
 
 
 # =============================================================================
 # INTEGRATION-STYLE TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group("integration")
 class TestIntegration:
     """Integration-style tests for complete flows."""
     
@@ -666,10 +890,9 @@ class TestIntegration:
         }
         
         # Verify event is for our solution
-        ssm_parameter_root = "/cpl/"
         param_name = event["detail"]["requestParameters"]["name"]
         
-        should_process = ssm_parameter_root in param_name
+        should_process = param_name.startswith(SSM_PARAMETER_ROOT)
         assert should_process is True
         
         # Verify we would use configurable names
@@ -691,51 +914,26 @@ class TestIntegration:
         }
         
         # Verify event is for our solution
-        ssm_parameter_root = "/cpl/"
         param_name = event["detail"]["requestParameters"]["name"]
         
-        should_process = ssm_parameter_root in param_name
+        should_process = param_name.startswith(SSM_PARAMETER_ROOT)
         assert should_process is True
     
-    def test_different_solution_names(self):
+    @pytest.mark.parametrize("name, expected_root, expected_filter, expected_param", [
+        ("cpl", "/cpl/", "CplAutoCreatedFilter", "Cpl_Filters"),
+        ("audit_log", "/audit_log/", "AuditLogAutoCreatedFilter", "AuditLog_Filters"),
+        ("my_solution", "/my_solution/", "MySolutionAutoCreatedFilter", "MySolution_Filters"),
+    ])
+    def test_different_solution_names(self, name, expected_root, expected_filter, expected_param):
         """Test that different solution names produce correct derived values."""
-        test_cases = [
-            {
-                "name": "cpl",
-                "expected_root": "/cpl/",
-                "expected_filter": "CplAutoCreatedFilter",
-                "expected_param": "Cpl_Filters"
-            },
-            {
-                "name": "audit_log",
-                "expected_root": "/audit_log/",
-                "expected_filter": "AuditLogAutoCreatedFilter",
-                "expected_param": "AuditLog_Filters"
-            },
-            {
-                "name": "my_solution",
-                "expected_root": "/my_solution/",
-                "expected_filter": "MySolutionAutoCreatedFilter",
-                "expected_param": "MySolution_Filters"
-            },
-        ]
-        
-        for case in test_cases:
-            name = case["name"]
-            
-            derived_root = f"/{name}/"
-            derived_filter = f"{name.title().replace('_', '')}AutoCreatedFilter"
-            derived_param = f"{name.title().replace('_', '')}_Filters"
-            
-            assert derived_root == case["expected_root"], f"Failed for {name}"
-            assert derived_filter == case["expected_filter"], f"Failed for {name}"
-            assert derived_param == case["expected_param"], f"Failed for {name}"
+        assert derive_names(name) == (expected_root, expected_filter, expected_param)
 
 
 # =============================================================================
 # EDGE CASE TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group("edge_cases")
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
     
@@ -752,141 +950,102 @@ class TestEdgeCases:
         parameters = [{"Name": "/cpl/malformed", "Value": "not-valid-json"}]
         
         for param in parameters:
-            try:
-                json.loads(param["Value"])
-                assert False, "Should have raised JSONDecodeError"
-            except json.JSONDecodeError:
-                pass  # Expected
+            with pytest.raises(JSONDecodeError):
+                json_loads(param["Value"])
     
-    def test_handles_nested_json_values(self):
+    def test_handles_nested_json_values(self, nested_json_param):
         """Test handling of parameters with nested JSON values."""
-        nested_value = {
-            "log_group_name_pattern": "*/api/*",
-            "prefix": "API",
-            "metadata": {
-                "created_by": "admin",
-                "tags": ["production", "api"]
-            }
-        }
-        
-        param = {"Name": "/cpl/nested", "Value": json.dumps(nested_value)}
-        parsed = json.loads(param["Value"])
+        parsed = nested_json_param["parsed"]
         
         assert parsed["log_group_name_pattern"] == "*/api/*"
         assert parsed["metadata"]["created_by"] == "admin"
     
-    def test_handles_special_characters_in_log_group_names(self):
+    @pytest.mark.parametrize("lg", [
+        "/aws/lambda/my-service",
+        "/aws/lambda/my_service",
+        "/aws/lambda/my.service",
+        "/aws/lambda/my:service",
+    ])
+    def test_handles_special_characters_in_log_group_names(self, lg):
         """Test handling of special characters in log group names."""
-        log_groups = [
-            "/aws/lambda/my-service",
-            "/aws/lambda/my_service",
-            "/aws/lambda/my.service",
-            "/aws/lambda/my:service",
-        ]
-        
-        for lg in log_groups:
-            assert lg.startswith("/")
+        assert lg.startswith("/")
     
     def test_handles_very_long_filter_lists(self):
         """Test handling of very long filter lists."""
         # SSM parameter values can be up to 4KB (standard) or 8KB (advanced)
-        filter_list = [f"*/service{i}/*" for i in range(100)]
-        
-        value = ",".join(filter_list)
-        
         # Should be well under the limit
-        assert len(value) < 4096
+        assert LONG_FILTER_BYTE_LEN < SSM_STANDARD_VALUE_LIMIT
     
-    def test_handles_unicode_in_parameters(self):
+    def test_handles_unicode_in_parameters(self, unicode_json_param):
         """Test handling of unicode characters in parameter values."""
-        param_value = {
-            "log_group_name_pattern": "*/api/*",
-            "prefix": "API",
-            "description": "日本語テスト"  # Japanese characters
-        }
-        
-        param = {"Name": "/cpl/unicode", "Value": json.dumps(param_value)}
-        parsed = json.loads(param["Value"])
+        parsed = unicode_json_param["parsed"]
         
         assert parsed["description"] == "日本語テスト"
+        assert unicode_json_param["byte_length"] < SSM_STANDARD_VALUE_LIMIT
     
-    def test_fnmatch_pattern_matching(self):
+    @pytest.mark.parametrize("pattern, log_group, expected", [
+        ("*/api/*", "/aws/lambda/api/service1", True),
+        ("*/api/*", "/aws/lambda/web/service1", False),
+        ("*/lambda/*", "/aws/lambda/api/service1", True),
+        ("*service*", "/aws/lambda/api/service1", True),
+        ("/aws/lambda/api/*", "/aws/lambda/api/service1", True),
+        ("/aws/lambda/api/*", "/aws/lambda/web/service1", False),
+    ])
+    def test_fnmatch_pattern_matching(self, index_module, pattern, log_group, expected):
         """Test fnmatch pattern matching behavior."""
-        import fnmatch
-        
-        test_cases = [
-            ("*/api/*", "/aws/lambda/api/service1", True),
-            ("*/api/*", "/aws/lambda/web/service1", False),
-            ("*/lambda/*", "/aws/lambda/api/service1", True),
-            ("*service*", "/aws/lambda/api/service1", True),
-            ("/aws/lambda/api/*", "/aws/lambda/api/service1", True),
-            ("/aws/lambda/api/*", "/aws/lambda/web/service1", False),
-        ]
-        
-        for pattern, log_group, expected in test_cases:
-            result = fnmatch.fnmatch(log_group, pattern)
-            assert result == expected, f"Pattern {pattern} vs {log_group} should be {expected}"
+        result = index_module.compile_patterns([pattern]).match(log_group) is not None
+        assert result == expected, f"Pattern {pattern} vs {log_group} should be {expected}"
 
 
 # =============================================================================
 # ERROR HANDLING TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group("error_handling")
 class TestErrorHandling:
     """Tests for error handling scenarios."""
     
     def test_handles_ssm_parameter_not_found(self, mock_boto3_clients):
         """Test handling when SSM parameter doesn't exist."""
         mock_ssm = mock_boto3_clients["ssm"]
-        mock_ssm.exceptions = MagicMock()
-        mock_ssm.exceptions.ParameterNotFound = type(
-            'ParameterNotFound', (Exception,), {}
-        )
-        mock_ssm.get_parameter.side_effect = mock_ssm.exceptions.ParameterNotFound()
+        mock_ssm.get_parameter.side_effect = PARAMETER_NOT_FOUND
         
-        try:
+        with pytest.raises(mock_ssm.exceptions.ParameterNotFound) as exc_info:
             mock_ssm.get_parameter(Name="NonExistent_Param")
-            assert False, "Should have raised exception"
-        except mock_ssm.exceptions.ParameterNotFound:
-            pass  # Expected
+        
+        assert exc_info.value.response["Error"]["Code"] == "ParameterNotFound"
     
     def test_handles_cloudwatch_access_denied(self, mock_boto3_clients):
         """Test handling when CloudWatch access is denied."""
         mock_logs = mock_boto3_clients["logs"]
         mock_logs.put_subscription_filter.side_effect = ClientError(
-            {"Error": {"Code": "AccessDeniedException", "Message": "Access Denied"}},
-            "PutSubscriptionFilter"
+            ACCESS_DENIED_RESPONSE, "PutSubscriptionFilter"
         )
         
-        try:
+        with pytest.raises(ClientError) as exc_info:
             mock_logs.put_subscription_filter(
                 destinationArn="arn:aws:lambda:eu-west-2:123456789012:function:test",
                 filterName="TestFilter",
                 filterPattern="[]",
                 logGroupName="/test/log/group",
             )
-            assert False, "Should have raised exception"
-        except ClientError as e:
-            assert e.response["Error"]["Code"] == "AccessDeniedException"
+        assert exc_info.value.response["Error"]["Code"] == "AccessDeniedException"
     
     def test_handles_ssm_put_parameter_failure(self, mock_boto3_clients):
         """Test handling when SSM put_parameter fails."""
         mock_ssm = mock_boto3_clients["ssm"]
         mock_ssm.put_parameter.side_effect = ClientError(
-            {"Error": {"Code": "ValidationException", "Message": "Invalid parameter"}},
-            "PutParameter"
+            VALIDATION_ERROR_RESPONSE, "PutParameter"
         )
         
-        try:
+        with pytest.raises(ClientError) as exc_info:
             mock_ssm.put_parameter(
                 Name="Test_Param",
                 Value="test",
                 Type="String",
                 Overwrite=True,
             )
-            assert False, "Should have raised exception"
-        except ClientError as e:
-            assert e.response["Error"]["Code"] == "ValidationException"
+        assert exc_info.value.response["Error"]["Code"] == "ValidationException"
 
 
 if __name__ == "__main__":
@@ -13,32 +13,41 @@ from unittest.mock import patch, MagicMock, call, ANY
 import json
 import os
 import sys
+from datetime import datetime, timedelta, timezone
 from botocore.exceptions import ClientError
 
 
 class TestGetCentralAccountSSMClient(unittest.TestCase):
     """Tests for get_central_account_ssm_client() function"""
     
-    def setUp(self):
-        """Set up test environment"""
-        self.central_account = "123456789012"
-        self.workload_account = "987654321098"
-        self.role_name = "ManagementLambdaCrossAccountRole"
-        self.region = "eu-west-2"
-        
-        # Set environment variables
-        self.env_patcher = patch.dict(os.environ, {
-            "AWS_REGION": self.region,
-            "OWNING_AWS_ACCOUNT": self.central_account,
-            "CROSS_ACCOUNT_ROLE_NAME": self.role_name,
-            "VARIABLE_LOGGING_NAME": "cpl",
-            "SSM_PARAMETER_ROOT": "/cpl/",
-        })
-        self.env_patcher.start()
+    central_account = "123456789012"
+    workload_account = "987654321098"
+    role_name = "ManagementLambdaCrossAccountRole"
+    region = "eu-west-2"
     
-    def tearDown(self):
-        """Clean up"""
-        self.env_patcher.stop()
+    # Environment variables shared by every test in the class
+    ENV = {
+        "AWS_REGION": region,
+        "OWNING_AWS_ACCOUNT": central_account,
+        "CROSS_ACCOUNT_ROLE_NAME": role_name,
+        "VARIABLE_LOGGING_NAME": "cpl",
+        "SSM_PARAMETER_ROOT": "/cpl/",
+    }
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set environment variables once for the class"""
+        cls.saved_env = {key: os.environ.get(key) for key in cls.ENV}
+        os.environ.update(cls.ENV)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the environment variables"""
+        for key, value in cls.saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
     
     @patch('boto3.client')
     def test_no_owning_account_configured(self, mock_boto_client):
@@ -163,10 +172,8 @@ class TestGetCentralAccountSSMClient(unittest.TestCase):
 class TestGetAllLocalParameters(unittest.TestCase):
     """Tests for get_all_local_parameters() function"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.ssm_parameter_root = "/cpl/"
-        
+    ssm_parameter_root = "/cpl/"
+    
     @patch('boto3.client')
     def test_no_parameters(self, mock_boto_client):
         """Should return empty dict when no parameters exist"""
@@ -292,12 +299,10 @@ class TestGetAllLocalParameters(unittest.TestCase):
 class TestSyncParametersToCentralAccount(unittest.TestCase):
     """Tests for sync_parameters_to_central_account() function"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.workload_account = "987654321098"
-        self.central_account = "123456789012"
-        self.central_prefix = "/accounts_cpl/"
-        
+    workload_account = "987654321098"
+    central_account = "123456789012"
+    central_prefix = "/accounts_cpl/"
+    
     @patch('boto3.client')
     def test_sync_with_parameters(self, mock_boto_client):
         """Should sync consolidated parameters to central account"""
@@ -420,7 +425,7 @@ class TestLambdaHandlerSyncIntegration(unittest.TestCase):
         event_name = event["detail"]["eventName"]
         param_name = event["detail"]["requestParameters"]["name"]
         
-        if event_name == "PutParameter" and "/cpl/" in param_name:
+        if event_name == "PutParameter" and param_name.startswith("/cpl/"):
             # update_subscription_filter_on_existing_log_groups(param_name)
             # reconcile_subscription_filters()
             mock_sync()  # sync_parameters_to_central_account()
@@ -449,7 +454,7 @@ class TestLambdaHandlerSyncIntegration(unittest.TestCase):
         event_name = event["detail"]["eventName"]
         param_name = event["detail"]["requestParameters"]["name"]
         
-        if event_name == "DeleteParameter" and "/cpl/" in param_name:
+        if event_name == "DeleteParameter" and param_name.startswith("/cpl/"):
             # reconcile_subscription_filters()
             mock_sync()  # sync_parameters_to_central_account()
         
@@ -504,7 +509,7 @@ class TestLambdaHandlerSyncIntegration(unittest.TestCase):
         event_name = event["detail"]["eventName"]
         param_name = event["detail"]["requestParameters"]["name"]
         
-        if event_name == "PutParameter" and "/cpl/" in param_name:
+        if event_name == "PutParameter" and param_name.startswith("/cpl/"):
             mock_sync()
         
         self.assertFalse(sync_called, "Sync should NOT be called for non-CPL parameters")
@@ -548,6 +553,330 @@ class TestConsolidatedConfigFormat(unittest.TestCase):
         self.assertEqual(json.loads(consolidated), {})
 
 
+class UpdateModuleTestCase(unittest.TestCase):
+    """Base for tests that import update.py against mocked clients and drive its lambda_handler"""
+    
+    tracking_param = "Cpl_Filters"
+    pattern = "/aws/lambda/api/*"
+    log_groups = ["/aws/lambda/api/service1", "/aws/lambda/api/service2", "/aws/lambda/api/service3"]
+    event = {
+        "detail": {
+            "eventName": "PutParameter",
+            "requestParameters": {"name": "/cpl/api"}
+        }
+    }
+    
+    # Environment update.py reads at import, with central account sync disabled
+    ENV = {
+        "AWS_REGION": "eu-west-2",
+        "AWS_ACCOUNT_ID": "987654321098",
+        "OWNING_AWS_ACCOUNT": "",
+        "VARIABLE_LOGGING_NAME": "cpl",
+        "SSM_PARAMETER_ROOT": "/cpl/",
+        "FILTERS_TRACKING_PARAM": tracking_param,
+        "SENDER_FUNCTION_NAME": "log-sender-function",
+    }
+    
+    class ParameterNotFound(ClientError):
+        """Stands in for the SSM client's ParameterNotFound"""
+    
+    class ResourceNotFoundException(ClientError):
+        """Stands in for the CloudWatch Logs client's ResourceNotFoundException"""
+    
+    def setUp(self):
+        """Import update.py against mocked clients holding one parameter and its matching log groups"""
+        self.mock_ssm = MagicMock()
+        self.mock_ssm.exceptions.ParameterNotFound = self.ParameterNotFound
+        self.mock_ssm.get_paginator.return_value.paginate.return_value = [{
+            "Parameters": [{
+                "Name": "/cpl/api",
+                "Value": json.dumps({"log_group_name_pattern": self.pattern, "prefix": ""})
+            }]
+        }]
+        self.mock_ssm.get_parameter.side_effect = self.ParameterNotFound(
+            {"Error": {"Code": "ParameterNotFound", "Message": "Not found"}},
+            "GetParameter"
+        )
+        
+        self.mock_logs = MagicMock()
+        self.mock_logs.exceptions.ResourceNotFoundException = self.ResourceNotFoundException
+        self.mock_logs.get_paginator.return_value.paginate.return_value = [
+            {"logGroups": [{"logGroupName": name} for name in self.log_groups]}
+        ]
+        self.mock_logs.describe_subscription_filters.return_value = {
+            "subscriptionFilters": [{"filterName": "CplAutoCreatedFilter"}]
+        }
+        
+        self.mock_sts = MagicMock()
+        # Returned for clients built with assumed-role credentials
+        self.mock_central_ssm = MagicMock()
+        
+        def client_factory(service, **kwargs):
+            if service == "ssm" and "aws_access_key_id" in kwargs:
+                return self.mock_central_ssm
+            return {"ssm": self.mock_ssm, "logs": self.mock_logs, "sts": self.mock_sts}[service]
+        
+        # Kept active for the whole test, as update.py builds the central client on demand
+        env_patch = patch.dict(os.environ, self.ENV)
+        client_patch = patch('boto3.client', side_effect=client_factory)
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        self.mock_boto_client = client_patch.start()
+        self.addCleanup(client_patch.stop)
+        
+        sys.modules.pop("update", None)
+        import update
+        self.update = update
+    
+    def tearDown(self):
+        sys.modules.pop("update", None)
+    
+    def tracking_puts(self):
+        """The put_parameter calls made on the tracking parameter"""
+        return [
+            c for c in self.mock_ssm.put_parameter.call_args_list
+            if c.kwargs["Name"] == self.tracking_param
+        ]
+
+
+class TestTrackingListWriteBack(UpdateModuleTestCase):
+    """Tests for the tracking list lambda_handler loads once and saves at the end of an invocation"""
+    
+    def test_single_put_for_many_log_groups(self):
+        """A PutParameter event over several matching log groups should write the tracking list once"""
+        self.update.lambda_handler(self.event, None)
+        
+        self.assertEqual(self.mock_logs.put_subscription_filter.call_count, len(self.log_groups))
+        puts = self.tracking_puts()
+        self.assertEqual(len(puts), 1)
+        self.assertEqual(puts[0].kwargs["Value"], self.pattern)
+    
+    def test_unchanged_list_not_written(self):
+        """A tracking list that already holds the current patterns should not be written again"""
+        self.mock_ssm.get_parameter.side_effect = None
+        self.mock_ssm.get_parameter.return_value = {
+            "Parameter": {"Name": self.tracking_param, "Value": self.pattern}
+        }
+        
+        self.update.lambda_handler(self.event, None)
+        
+        self.assertEqual(self.tracking_puts(), [])
+    
+    def test_entries_saved_when_handler_fails(self):
+        """Entries added before a failure should still be saved, and the failure re-raised"""
+        self.mock_logs.put_subscription_filter.side_effect = [
+            None,
+            ClientError(
+                {"Error": {"Code": "LimitExceededException", "Message": "Too many filters"}},
+                "PutSubscriptionFilter"
+            ),
+        ]
+        
+        with self.assertRaises(ClientError):
+            self.update.lambda_handler(self.event, None)
+        
+        puts = self.tracking_puts()
+        self.assertEqual(len(puts), 1)
+        self.assertEqual(puts[0].kwargs["Value"], self.pattern)
+    
+    def test_save_failure_does_not_hide_handler_error(self):
+        """A failure saving the tracking list should not replace the handler's own error"""
+        self.mock_logs.put_subscription_filter.side_effect = ClientError(
+            {"Error": {"Code": "LimitExceededException", "Message": "Too many filters"}},
+            "PutSubscriptionFilter"
+        )
+        self.mock_ssm.put_parameter.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            "PutParameter"
+        )
+        
+        with self.assertRaises(ClientError) as context:
+            self.update.lambda_handler(self.event, None)
+        
+        self.assertEqual(context.exception.response["Error"]["Code"], "LimitExceededException")
+        self.assertEqual(len(self.tracking_puts()), 1)
+    
+    def test_throttled_read_not_overwritten(self):
+        """A tracking list that could not be read should not be overwritten with only the new entries"""
+        self.mock_ssm.get_parameter.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            "GetParameter"
+        )
+        event = {
+            "detail": {
+                "eventName": "CreateLogGroup",
+                "requestParameters": {"logGroupName": "/aws/lambda/api/new"}
+            }
+        }
+        
+        self.update.lambda_handler(event, None)
+        
+        self.mock_logs.put_subscription_filter.assert_called_once()
+        self.assertEqual(self.tracking_puts(), [])
+
+
+class TestCentralAccountSyncHandler(UpdateModuleTestCase):
+    """Tests for what lambda_handler writes to the central account, and the reconcile skip before it"""
+    
+    central_account = "123456789012"
+    central_param = "/accounts_cpl/987654321098"
+    ENV = dict(UpdateModuleTestCase.ENV, OWNING_AWS_ACCOUNT=central_account)
+    delete_event = {
+        "detail": {
+            "eventName": "DeleteParameter",
+            "requestParameters": {"name": "/cpl/old"}
+        }
+    }
+    
+    def setUp(self):
+        super().setUp()
+        self.set_credentials_expiry(timedelta(hours=1))
+        # Compact, sorted JSON of the single local parameter, as the Lambda writes it
+        self.consolidated_value = json.dumps(
+            {"api": {"log_group_name_pattern": self.pattern, "prefix": ""}},
+            separators=(",", ":"),
+            sort_keys=True
+        )
+    
+    def set_credentials_expiry(self, remaining):
+        """Make assume_role return credentials expiring `remaining` from now"""
+        self.mock_sts.assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "AKIA",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc) + remaining,
+            }
+        }
+    
+    def set_central_value(self, value=None, error_code=None):
+        """Make the central account hold `value`, or fail the read with `error_code`"""
+        if error_code:
+            self.mock_central_ssm.get_parameter.side_effect = ClientError(
+                {"Error": {"Code": error_code, "Message": error_code}}, "GetParameter"
+            )
+        else:
+            self.mock_central_ssm.get_parameter.return_value = {
+                "Parameter": {"Name": self.central_param, "Value": value}
+            }
+    
+    def test_unchanged_value_not_written(self):
+        """Should not write the central parameter when it already holds the consolidated value"""
+        self.set_central_value(self.consolidated_value)
+        
+        self.update.lambda_handler(self.delete_event, None)
+        
+        self.mock_central_ssm.get_parameter.assert_called_once_with(Name=self.central_param)
+        self.mock_central_ssm.put_parameter.assert_not_called()
+    
+    def test_changed_value_written(self):
+        """Should overwrite a central parameter that was edited out of band"""
+        self.set_central_value('{"api":{"log_group_name_pattern":"*"}}')
+        
+        self.update.lambda_handler(self.delete_event, None)
+        
+        self.mock_central_ssm.put_parameter.assert_called_once_with(
+            Name=self.central_param,
+            Description=ANY,
+            Value=self.consolidated_value,
+            Type="String",
+            Overwrite=True
+        )
+    
+    def test_out_of_band_edit_repaired_on_warm_invocation(self):
+        """Should compare against the live central value on every invocation, not a remembered one"""
+        self.set_central_value(self.consolidated_value)
+        self.update.lambda_handler(self.delete_event, None)
+        
+        self.set_central_value('{"api":{"log_group_name_pattern":"*"}}')
+        self.update.lambda_handler(self.delete_event, None)
+        
+        self.mock_central_ssm.put_parameter.assert_called_once()
+    
+    def test_missing_central_parameter_written(self):
+        """Should write the central parameter when it does not exist yet"""
+        self.set_central_value(error_code="ParameterNotFound")
+        
+        self.update.lambda_handler(self.delete_event, None)
+        
+        self.mock_central_ssm.put_parameter.assert_called_once_with(
+            Name=self.central_param,
+            Description=ANY,
+            Value=self.consolidated_value,
+            Type="String",
+            Overwrite=True
+        )
+    
+    def test_unreadable_central_parameter_written_with_warning(self):
+        """Should warn and still write when the central parameter cannot be read"""
+        self.set_central_value(error_code="AccessDeniedException")
+        
+        with self.assertLogs("LambdaLogger", level="WARNING") as logs:
+            self.update.lambda_handler(self.delete_event, None)
+        
+        self.assertTrue(any("Could not read current central parameter" in line for line in logs.output))
+        self.mock_central_ssm.put_parameter.assert_called_once()
+    
+    def test_central_client_reused_until_expiry(self):
+        """Should assume the role once while the cached credentials are still valid"""
+        self.set_central_value(self.consolidated_value)
+        
+        self.update.lambda_handler(self.delete_event, None)
+        self.update.lambda_handler(self.delete_event, None)
+        
+        self.mock_sts.assume_role.assert_called_once()
+    
+    def test_central_client_refreshed_near_expiry(self):
+        """Should assume the role again once the cached credentials are within the refresh margin"""
+        self.set_central_value(self.consolidated_value)
+        self.set_credentials_expiry(timedelta(minutes=1))
+        
+        self.update.lambda_handler(self.delete_event, None)
+        self.update.lambda_handler(self.delete_event, None)
+        
+        self.assertEqual(self.mock_sts.assume_role.call_count, 2)
+    
+    def test_nested_cpl_segment_no_sync(self):
+        """Parameters that only contain /cpl/ further down the path should not trigger sync"""
+        event = {
+            "detail": {
+                "eventName": "PutParameter",
+                "requestParameters": {
+                    "name": "/some-other-app/cpl/config"
+                }
+            }
+        }
+        
+        self.update.lambda_handler(event, None)
+        
+        self.mock_sts.assume_role.assert_not_called()
+        self.mock_central_ssm.put_parameter.assert_not_called()
+        self.mock_central_ssm.delete_parameter.assert_not_called()
+        self.mock_logs.put_subscription_filter.assert_not_called()
+    
+    def test_reconcile_skipped_with_nothing_tracked(self):
+        """Should skip the log group scan when no patterns remain and the tracking parameter is absent"""
+        self.mock_ssm.get_paginator.return_value.paginate.return_value = [{"Parameters": []}]
+        
+        self.update.lambda_handler(self.delete_event, None)
+        
+        self.mock_logs.get_paginator.assert_not_called()
+        self.mock_central_ssm.delete_parameter.assert_called_once_with(Name=self.central_param)
+    
+    def test_reconcile_scans_when_tracking_read_fails(self):
+        """Should still scan and remove filters when the tracking parameter cannot be read"""
+        self.mock_ssm.get_paginator.return_value.paginate.return_value = [{"Parameters": []}]
+        self.mock_ssm.get_parameter.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "GetParameter"
+        )
+        
+        self.update.lambda_handler(self.delete_event, None)
+        
+        self.assertEqual(
+            self.mock_logs.delete_subscription_filter.call_count, len(self.log_groups)
+        )
+
+
 def run_tests():
     """Run all test suites"""
     loader = unittest.TestLoader()
@@ -559,8 +888,11 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestSyncParametersToCentralAccount))
     suite.addTests(loader.loadTestsFromTestCase(TestLambdaHandlerSyncIntegration))
     suite.addTests(loader.loadTestsFromTestCase(TestConsolidatedConfigFormat))
+    suite.addTests(loader.loadTestsFromTestCase(TestTrackingListWriteBack))
+    suite.addTests(loader.loadTestsFromTestCase(TestCentralAccountSyncHandler))
     
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Output from passing tests is discarded, failures still show what they printed
+    runner = unittest.TextTestRunner(verbosity=1, buffer=True)
     result = runner.run(suite)
     
     return result
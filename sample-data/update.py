@@ -2,8 +2,29 @@ import logging
 import json
 import os
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import fnmatch
+import functools
+import re
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 
+# orjson parses parameter values faster when it is packaged with the function
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps_compact(value):
+        """Serialize to compact JSON with sorted keys"""
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode()
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_compact(value):
+        """Serialize to compact JSON with sorted keys"""
+        return json.dumps(value, separators=(",", ":"), sort_keys=True)
 
 AWS_REGION = os.getenv("AWS_REGION", "eu-west-2")
 VARIABLE_LOGGING_NAME = os.getenv("VARIABLE_LOGGING_NAME", "cpl")
@@ -29,6 +50,12 @@ CROSS_ACCOUNT_ROLE_NAME = os.getenv("CROSS_ACCOUNT_ROLE_NAME", "ManagementLambda
 # Sender function for subscription filters
 SENDER_FUNCTION_NAME = os.getenv("SENDER_FUNCTION_NAME")
 
+# Upper bound on concurrent CloudWatch Logs calls, kept low to stay clear of API throttling
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "16"))
+
+# First characters a JSON document can start with (object, array, string, number, true/false/null)
+JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -38,12 +65,40 @@ logging_level = os.getenv("LOGGING_LEVEL", "INFO").upper()
 logging.basicConfig(level=logging_level)
 logger.setLevel(logging_level)
 
-cloudwatch_logs_client = boto3.client("logs", region_name=AWS_REGION)
+# Size the connection pool to the worker count so concurrent calls do not queue for a connection,
+# and keep idle pooled connections alive between warm invocations
+boto_config = Config(
+    max_pool_connections=MAX_CONCURRENT_REQUESTS,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+)
+cloudwatch_logs_client = boto3.client("logs", region_name=AWS_REGION, config=boto_config)
 ssm_client = boto3.client("ssm", region_name=AWS_REGION)
 sts_client = boto3.client("sts", region_name=AWS_REGION)
-
-# Get local account ID
-LOCAL_ACCOUNT_ID = sts_client.get_caller_identity()["Account"]
+# Paginators are stateless between paginate() calls, so build this one once per cold start
+parameters_paginator = ssm_client.get_paginator("get_parameters_by_path")
+
+# Account ID is fixed for the life of the execution environment, so resolve it once per cold start
+LOCAL_ACCOUNT_ID = os.getenv("AWS_ACCOUNT_ID") or sts_client.get_caller_identity()["Account"]
+# Sender Lambda that every Subscription Filter points at
+DESTINATION_ARN = f"arn:aws:lambda:{AWS_REGION}:{LOCAL_ACCOUNT_ID}:function:{SENDER_FUNCTION_NAME}"
+
+# Central account SSM client, reused across warm invocations until its credentials near expiry
+central_ssm_client_cache = None
+central_ssm_client_expiry = None
+# Assume the role again this long before the cached credentials expire
+CREDENTIAL_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Parsed `SSM_PARAMETER_ROOT` parameters, loaded once per invocation
+parameters_cache = None
+# Combined regex of the cached parameters' log group name patterns
+parameters_matcher = None
+# `FILTERS_TRACKING_PARAM` entries, read at most once per invocation
+tracking_cache = None
+# Whether `tracking_cache` has changes that are not yet saved to Parameter Store
+tracking_changed = False
+# Whether reading `FILTERS_TRACKING_PARAM` failed for a reason other than it not existing
+tracking_read_failed = False
 
 
 # =============================================================================
@@ -54,6 +109,9 @@ def get_central_account_ssm_client():
     """
     Creates an SSM client for the central audit account using STS assume role.
     
+    The client is cached and reused until its assumed-role credentials are within
+    `CREDENTIAL_REFRESH_MARGIN` of expiring.
+    
     Returns:
         boto3.client: SSM client for central account, or None if not configured
     """
@@ -68,6 +126,13 @@ def get_central_account_ssm_client():
         logger.info("Already in central account - using local SSM client")
         return ssm_client
     
+    global central_ssm_client_cache, central_ssm_client_expiry
+    if central_ssm_client_cache is not None and (
+        datetime.now(timezone.utc) < central_ssm_client_expiry - CREDENTIAL_REFRESH_MARGIN
+    ):
+        logger.debug("Reusing cached central account SSM client")
+        return central_ssm_client_cache
+    
     try:
         role_arn = f"arn:aws:iam::{OWNING_AWS_ACCOUNT}:role/{CROSS_ACCOUNT_ROLE_NAME}"
         logger.info(f"Assuming role in central account: {role_arn}")
@@ -88,6 +153,12 @@ def get_central_account_ssm_client():
         )
         
         logger.info("Successfully created central account SSM client")
+        
+        # boto3 parses Expiration into an aware datetime, only cache when it did
+        expiration = credentials.get("Expiration")
+        if isinstance(expiration, datetime):
+            central_ssm_client_cache = central_ssm_client
+            central_ssm_client_expiry = expiration
         return central_ssm_client
         
     except Exception as error:
@@ -106,11 +177,107 @@ def get_parameters_generator():
     Yields:
         list[dict]: The parameter objects under the `SSM_PARAMETER_ROOT` hierarchy
     """
-    paginator = ssm_client.get_paginator("get_parameters_by_path")
-    for page in paginator.paginate(Path=SSM_PARAMETER_ROOT, Recursive=True):
+    # 10 is the GetParametersByPath maximum
+    for page in parameters_paginator.paginate(
+        Path=SSM_PARAMETER_ROOT, Recursive=True, PaginationConfig={"PageSize": 10}
+    ):
         yield from page["Parameters"]
 
 
+def get_all_parameters():
+    """
+    Gets all parameters under the `SSM_PARAMETER_ROOT` hierarchy with their values parsed.
+    
+    Parameter Store is only paginated on the first call of an invocation, later calls reuse the result.
+    
+    Returns:
+        list[tuple[str, dict]]: The parameter names and their parsed JSON values
+    """
+    global parameters_cache, parameters_matcher
+    if parameters_cache is None:
+        parameters_cache = [
+            (parameter["Name"], json_loads(parameter["Value"]))
+            for parameter in get_parameters_generator()
+        ]
+        parameters_matcher = None
+    return parameters_cache
+
+
+@functools.lru_cache(maxsize=None)
+def translate_glob(pattern):
+    """
+    Translates a glob pattern to a regular expression string, caching the result.
+    
+    The same handful of patterns are translated repeatedly, e.g. every time the tracking list
+    is combined, and `fnmatch.translate` itself is not cached.
+    
+    Args:
+        pattern (str): The glob pattern to translate
+    
+    Returns:
+        str: The equivalent regular expression
+    """
+    return fnmatch.translate(pattern)
+
+
+def compile_patterns(patterns):
+    """
+    Compiles glob patterns into a single regex.
+    
+    Each pattern is wrapped in a named group `p<index>`, so `match.lastgroup` identifies the first
+    pattern that matched.
+    
+    Args:
+        patterns (list[str]): The glob patterns to combine
+    
+    Returns:
+        re.Pattern: A regex matching any name matched by one of the patterns
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile(
+        "|".join(
+            f"(?P<p{index}>{translate_glob(pattern)})"
+            for index, pattern in enumerate(patterns)
+        )
+    )
+
+
+def get_parameters_matcher():
+    """
+    Gets the combined regex of the cached parameters' "log_group_name_pattern" patterns.
+    
+    The regex is compiled once per invocation and shared by `match_parameter` and the reconcile pass.
+    Group `p<index>` corresponds to the parameter at that index in `get_all_parameters()`.
+    
+    Returns:
+        re.Pattern: A regex matching any log group covered by a parameter
+    """
+    global parameters_matcher
+    parameters = get_all_parameters()
+    if parameters_matcher is None:
+        parameters_matcher = compile_patterns(
+            [json_data["log_group_name_pattern"] for _, json_data in parameters]
+        )
+    return parameters_matcher
+
+
+def match_parameter(log_group_name):
+    """
+    Finds the first parameter whose "log_group_name_pattern" matches a log group.
+    
+    Args:
+        log_group_name (str): The name of the log group to match
+    
+    Returns:
+        dict: The parsed value of the matching parameter, or None if no pattern matches
+    """
+    match = get_parameters_matcher().match(log_group_name)
+    if match is None:
+        return None
+    return get_all_parameters()[int(match.lastgroup[1:])][1]
+
+
 def get_all_local_parameters():
     """
     Retrieves all parameters from the local account under SSM_PARAMETER_ROOT.
@@ -119,20 +286,23 @@ def get_all_local_parameters():
         dict: Dictionary with parameter names (without prefix) as keys and their values
     """
     parameters = {}
+    # Every name returned under SSM_PARAMETER_ROOT starts with it, so a slice drops the prefix
+    prefix_length = len(SSM_PARAMETER_ROOT)
     
     for parameter in get_parameters_generator():
-        # Extract the key name (remove the SSM_PARAMETER_ROOT prefix)
-        param_name = parameter["Name"]
-        key_name = param_name.replace(SSM_PARAMETER_ROOT, "").strip("/")
+        key_name = parameter["Name"][prefix_length:].strip("/")
         
-        # Parse the JSON value if possible
-        try:
-            param_value = json.loads(parameter["Value"])
-        except json.JSONDecodeError:
-            param_value = parameter["Value"]
+        # Parse the JSON value if possible, orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        # Values that cannot start a JSON document skip the parser and its costly exception.
+        param_value = parameter["Value"]
+        if param_value.lstrip()[:1] in JSON_START_CHARS:
+            try:
+                param_value = json_loads(param_value)
+            except json.JSONDecodeError:
+                pass
         
         parameters[key_name] = param_value
-        logger.debug(f"Retrieved parameter: {key_name}")
+        logger.debug("Retrieved parameter: %s", key_name)
     
     logger.info(f"Retrieved {len(parameters)} parameters from local account")
     return parameters
@@ -152,6 +322,8 @@ def sync_parameters_to_central_account():
             "config1": {"setting": "value1"},
             "config2": {"setting": "value2"}
         }
+    
+    The write is skipped when the central account already holds the consolidated value.
     """
     central_ssm_client = get_central_account_ssm_client()
     if not central_ssm_client:
@@ -166,11 +338,31 @@ def sync_parameters_to_central_account():
         central_param_name = f"{CENTRAL_SSM_PARAMETER_PREFIX}{LOCAL_ACCOUNT_ID}"
         
         if consolidated_config:
+            # Compact output leaves more room under the 4 KB Standard tier limit, sorted keys keep the value stable
+            consolidated_value = json_dumps_compact(consolidated_config)
+            
+            # Compare against what the central account holds now, so out-of-band edits are overwritten
+            central_value = None
+            try:
+                response = central_ssm_client.get_parameter(Name=central_param_name)
+                central_value = response["Parameter"]["Value"]
+            except ClientError as error:
+                if error.response["Error"]["Code"] != "ParameterNotFound":
+                    logger.warning(
+                        f"Could not read current central parameter {central_param_name}: {error}"
+                    )
+            
+            if consolidated_value == central_value:
+                logger.info(
+                    f"Central account parameter already up to date: {central_param_name}"
+                )
+                return
+            
             # Write consolidated config to central audit account
             central_ssm_client.put_parameter(
                 Name=central_param_name,
                 Description=f"Consolidated {VARIABLE_LOGGING_NAME} config from workload account {LOCAL_ACCOUNT_ID}",
-                Value=json.dumps(consolidated_config, indent=2),
+                Value=consolidated_value,
                 Type="String",
                 Overwrite=True
             )
@@ -185,7 +377,10 @@ def sync_parameters_to_central_account():
                 logger.info(
                     f"Deleted central account parameter (no local params): {central_param_name}"
                 )
-            except central_ssm_client.exceptions.ParameterNotFound:
+            except ClientError as error:
+                # Match on the error code rather than the client's generated exception class
+                if error.response["Error"]["Code"] != "ParameterNotFound":
+                    raise
                 logger.debug(
                     f"Central parameter does not exist (nothing to delete): {central_param_name}"
                 )
@@ -213,7 +408,7 @@ def get_prefix(json_data):
     prefix = "[]"
     if "prefix" in json_data:
         prefix = json_data["prefix"]
-        logger.debug(f"Prefix Loaded: {prefix}")
+        logger.debug("Prefix Loaded: %s", prefix)
         if (prefix != "") and (prefix != "[]"):
             prefix = "%^" + prefix + "*%"
     else:
@@ -226,10 +421,107 @@ def get_prefix(json_data):
 # SUBSCRIPTION FILTER FUNCTIONS
 # =============================================================================
 
+def get_tracking_list():
+    """
+    Gets the `FILTERS_TRACKING_PARAM` entries.
+    
+    Parameter Store is only read on the first call of an invocation, later calls return the same list.
+    Changes made through `add_tracking_entry` are written back by `save_tracking_list`.
+    
+    Returns:
+        list[str]: The tracked log group names and patterns
+    """
+    global tracking_cache, tracking_read_failed
+    if tracking_cache is None:
+        try:
+            base_param = ssm_client.get_parameter(Name=FILTERS_TRACKING_PARAM)
+            tracking_cache = base_param["Parameter"]["Value"].split(",")
+        except ssm_client.exceptions.ParameterNotFound as error:
+            tracking_cache = []
+            logger.info(f"{error} No {FILTERS_TRACKING_PARAM} Param Yet")
+        except Exception as error:
+            tracking_cache = []
+            tracking_read_failed = True
+            logger.warning(f"Could not read {FILTERS_TRACKING_PARAM}: {error}")
+    return tracking_cache
+
+
+def add_tracking_entry(entry):
+    """
+    Adds a log group name or pattern to the cached tracking list if it is not already there.
+    
+    Args:
+        entry (str): The log group name or pattern to track
+    """
+    global tracking_changed
+    tracking_list = get_tracking_list()
+    if entry not in tracking_list:
+        tracking_list.append(entry)
+        tracking_changed = True
+
+
+def replace_tracking_list(entries):
+    """
+    Replaces the tracking list with a new set of entries and saves it.
+    
+    Nothing is written when the list already loaded this invocation holds exactly these entries.
+    
+    Args:
+        entries (list[str]): The log group names or patterns to track
+    """
+    global tracking_cache, tracking_changed, tracking_read_failed
+    entries = list(entries)
+    if not tracking_changed and entries == tracking_cache:
+        logger.debug(f"{FILTERS_TRACKING_PARAM} already up to date")
+        return
+    tracking_cache = entries
+    tracking_changed = True
+    # The new entries are the complete list, so it no longer depends on the stored value
+    tracking_read_failed = False
+    save_tracking_list()
+
+
+def save_tracking_list():
+    """
+    Writes the cached tracking list to `FILTERS_TRACKING_PARAM` if it has unsaved changes.
+    
+    Nothing is written when the stored list could not be read, as the cache would only hold this invocation's
+    additions and saving it would drop every entry already tracked.
+    """
+    global tracking_changed
+    if tracking_changed:
+        if tracking_read_failed:
+            logger.warning(
+                f"Not saving {FILTERS_TRACKING_PARAM} - the stored list could not be read, so saving would drop its entries"
+            )
+            return
+        subscription_filter_param(tracking_cache)
+        tracking_changed = False
+
+
+def delete_tracking_param(reason=""):
+    """
+    Deletes `FILTERS_TRACKING_PARAM` and discards any unsaved tracking changes.
+    
+    Args:
+        reason (str): Optional context appended to the log message
+    """
+    global tracking_cache, tracking_changed
+    tracking_cache = []
+    tracking_changed = False
+    try:
+        ssm_client.delete_parameter(Name=FILTERS_TRACKING_PARAM)
+        logger.info(f"Deleted {FILTERS_TRACKING_PARAM} SSM parameter{reason}")
+    except ssm_client.exceptions.ParameterNotFound:
+        logger.debug(f"{FILTERS_TRACKING_PARAM} parameter does not exist")
+
+
 def add_subscription_filter(log_group_name, prefix=None):
     """
     Adds a Subscription Filter to a log group pointing to a given Lambda function.
     
+    The log group is recorded in the cached tracking list, which is saved at the end of the invocation.
+    
     Args:
         log_group_name (str): The name of the log group to add the Subscription Filter to
         prefix (str): Subscription Filter prefix for logs
@@ -239,44 +531,30 @@ def add_subscription_filter(log_group_name, prefix=None):
     """
     if prefix is None:
         logger.debug("No Prefix Parameter")
-        parameters = [item for item in get_parameters_generator()]
-        for parameter in parameters:
-            json_data = json.loads(parameter["Value"])
-            if bool(
-                fnmatch.filter(
-                    [log_group_name], json_data["log_group_name_pattern"]
-                )
-            ):
-                prefix = get_prefix(json_data)
-                break
+        json_data = match_parameter(log_group_name)
+        if json_data is not None:
+            prefix = get_prefix(json_data)
         logger.info(f"Prefix Loaded From Store: {prefix}")
     else:
-        logger.debug(f"Prefix Parameter Loaded: {prefix}")
+        logger.debug("Prefix Parameter Loaded: %s", prefix)
     
     logger.info(f"Applying Prefix: {prefix}")
-    account_id = (
-        boto3.client("sts", region_name=AWS_REGION)
-        .get_caller_identity()
-        .get("Account")
-    )
     try:
         cloudwatch_logs_client.put_subscription_filter(
-            destinationArn=f"arn:aws:lambda:{AWS_REGION}:{account_id}:function:{SENDER_FUNCTION_NAME}",
+            destinationArn=DESTINATION_ARN,
             filterName=FILTER_NAME_PREFIX,
             filterPattern=prefix,
             logGroupName=log_group_name,
         )
-        base_param = ssm_client.get_parameter(Name=FILTERS_TRACKING_PARAM)
-        logGroupList = base_param["Parameter"]["Value"].split(",")
+        logGroupList = get_tracking_list()
         logger.debug(logGroupList)
         
         # Ensures that multiple entries of the same log group do not appear
-        if any(fnmatch.fnmatch(log_group_name, x) for x in logGroupList):
-            pass
-        else:
-            logGroupList.append(log_group_name)
-        
-        subscription_filter_param(logGroupList)
+        # Entries may be patterns, so fall back to a single combined glob match when there is no exact entry
+        if log_group_name not in logGroupList and not compile_patterns(
+            logGroupList
+        ).match(log_group_name):
+            add_tracking_entry(log_group_name)
     
     except Exception as error:
         logger.error(f"Failed to add Subscription Filter: {error}")
@@ -290,57 +568,88 @@ def add_subscription_filter_to_new_log_group(log_group_name):
     Args:
         log_group_name (str): The name of the log group to add a Subscription Filter to
     """
-    parameters = [item for item in get_parameters_generator()]
-    for parameter in parameters:
-        json_data = json.loads(parameter["Value"])
+    json_data = match_parameter(log_group_name)
+    if json_data is not None:
+        # Only the matching parameter's prefix is needed
         prefix = get_prefix(json_data)
-        if bool(
-            fnmatch.filter(
-                [log_group_name], json_data["log_group_name_pattern"]
-            )
-        ):
-            logger.info(
-                f"{log_group_name} matches {json_data['log_group_name_pattern']} pattern. Adding Subscription Filter"
-            )
-            add_subscription_filter(log_group_name, prefix)
-            return
+        logger.info(
+            f"{log_group_name} matches {json_data['log_group_name_pattern']} pattern. Adding Subscription Filter"
+        )
+        add_subscription_filter(log_group_name, prefix)
 
 
-def describe_log_groups_generator():
+def describe_log_group_name_pages(prefix=None):
     """
-    Gets all CloudWatch log groups in a given AWS region.
+    Gets the names of all CloudWatch log groups in a given AWS region, one page at a time.
+    
+    Args:
+        prefix (str, optional): Only list log groups whose names start with this prefix
     
     Yields:
-        list[dict]: The CloudWatch log groups
+        list[str]: The CloudWatch log group names in each page
     """
-    cloudwatch_logs_client = boto3.client("logs", region_name=AWS_REGION)
     paginator = cloudwatch_logs_client.get_paginator("describe_log_groups")
-    for page in paginator.paginate():
-        yield from page["logGroups"]
+    kwargs = {"logGroupNamePrefix": prefix} if prefix else {}
+    for page in paginator.paginate(**kwargs):
+        yield [log_group["logGroupName"] for log_group in page["logGroups"]]
 
 
-def get_matching_log_groups(parameter_name, log_groups):
+def describe_log_group_names(prefix=None):
+    """
+    Gets the names of all CloudWatch log groups in a given AWS region.
+    
+    Args:
+        prefix (str, optional): Only list log groups whose names start with this prefix
+    
+    Returns:
+        list[str]: The CloudWatch log group names
+    """
+    return [
+        name for names in describe_log_group_name_pages(prefix) for name in names
+    ]
+
+
+def get_literal_prefix(pattern):
+    """
+    Returns the part of an fnmatch pattern before its first wildcard.
+    
+    Args:
+        pattern (str): The "log_group_name_pattern" to take the prefix of
+    
+    Returns:
+        str: The literal prefix, empty if the pattern starts with a wildcard
+    """
+    return re.match(r"[^*?\[]*", pattern).group()
+
+
+def get_matching_log_groups(parameter_name):
     """
     Retrieves the "log_group_name_pattern" pattern for a parameter and finds all log groups matching the pattern.
     
+    Only log groups sharing the pattern's literal prefix are listed, so CloudWatch Logs does the
+    coarse filtering and fnmatch only checks the remainder.
+    
     Args:
         parameter_name (str): The name of the parameter to look up in Parameter Store
-        log_groups (list[str]): The array of log groups to pattern match against
     
     Returns:
         list[str]: An array of matching log groups
         dict: The parameter object
     """
-    response = ssm_client.get_parameter(Name=parameter_name)
-    parameter_info = json.loads(response["Parameter"]["Value"])
-    matched_log_groups = []
-    for log_group in log_groups:
-        if bool(
-            fnmatch.filter(
-                [log_group], parameter_info["log_group_name_pattern"]
-            )
-        ):
-            matched_log_groups.append(log_group)
+    for name, parameter_info in get_all_parameters():
+        if name == parameter_name:
+            break
+    else:
+        # Not under the paginated hierarchy, fall back to a direct lookup
+        response = ssm_client.get_parameter(Name=parameter_name)
+        parameter_info = json_loads(response["Parameter"]["Value"])
+    pattern = parameter_info["log_group_name_pattern"]
+    pattern_regex = re.compile(translate_glob(pattern))
+    matched_log_groups = [
+        log_group
+        for log_group in describe_log_group_names(get_literal_prefix(pattern))
+        if pattern_regex.match(log_group)
+    ]
     return matched_log_groups, parameter_info
 
 
@@ -351,12 +660,7 @@ def update_subscription_filter_on_existing_log_groups(parameter_name):
     Args:
         parameter_name (str): The name of the parameter to look up in Parameter Store
     """
-    all_log_groups = [
-        item["logGroupName"] for item in describe_log_groups_generator()
-    ]
-    matched_log_groups, parameter_info = get_matching_log_groups(
-        parameter_name, all_log_groups
-    )
+    matched_log_groups, parameter_info = get_matching_log_groups(parameter_name)
     
     if len(matched_log_groups) == 0:
         logger.info(
@@ -365,26 +669,11 @@ def update_subscription_filter_on_existing_log_groups(parameter_name):
         return
     
     for log_group in matched_log_groups:
-        logGroupListNew = []
         logGroupToAdd = ""
-        parameters = [item for item in get_parameters_generator()]
-        for parameter in parameters:
-            json_data = json.loads(parameter["Value"])
-            if bool(
-                fnmatch.filter([log_group], json_data["log_group_name_pattern"])
-            ):
-                logGroupToAdd = str(json_data["log_group_name_pattern"])
-        
-        try:
-            base_param = ssm_client.get_parameter(Name=FILTERS_TRACKING_PARAM)
-            logGroupList = base_param["Parameter"]["Value"].split(",")
-            if logGroupToAdd not in logGroupList:
-                logGroupList.append(logGroupToAdd)
-            logGroupListNew = logGroupList
-        except Exception as error:
-            logGroupListNew.append(logGroupToAdd)
-            logger.info(f"{error} No {FILTERS_TRACKING_PARAM} Param Yet")
-        subscription_filter_param(logGroupListNew)
+        json_data = match_parameter(log_group)
+        if json_data is not None:
+            logGroupToAdd = str(json_data["log_group_name_pattern"])
+        add_tracking_entry(logGroupToAdd)
         
         logger.info(
             f"{log_group} matches {parameter_info['log_group_name_pattern']} pattern. Adding Subscription Filter"
@@ -392,40 +681,63 @@ def update_subscription_filter_on_existing_log_groups(parameter_name):
         add_subscription_filter(log_group)
 
 
+def has_subscription_filter(log_group_name):
+    """
+    Check whether a log group currently has our subscription filter.
+    
+    Args:
+        log_group_name (str): The name of the log group to check
+    
+    Returns:
+        bool: True if the filter is present, False if it is absent or could not be checked
+    """
+    try:
+        filters = cloudwatch_logs_client.describe_subscription_filters(
+            logGroupName=log_group_name,
+            filterNamePrefix=FILTER_NAME_PREFIX,
+        )
+        
+        if filters["subscriptionFilters"]:
+            logger.debug("Found filter on: %s", log_group_name)
+            return True
+    except cloudwatch_logs_client.exceptions.ResourceNotFoundException:
+        # Log group was deleted between describe_log_groups and describe_subscription_filters
+        logger.debug("Log group no longer exists: %s", log_group_name)
+    except Exception as error:
+        logger.warning(
+            f"Could not check filters for {log_group_name}: {error}"
+        )
+    return False
+
+
 def get_log_groups_with_filters():
     """
     Find all log groups that currently have our subscription filter.
     
     This function queries the actual CloudWatch Logs state to find which log groups
     have the auto-created filter, providing a source-of-truth approach
-    that is resilient to drift and manual changes.
+    that is resilient to drift and manual changes. The per-log-group lookups are
+    issued concurrently, up to `MAX_CONCURRENT_REQUESTS` at a time, starting as soon as
+    each page of log groups arrives.
     
     Returns:
         list[str]: List of log group names that have our subscription filter
     """
-    log_groups_with_filters = []
     logger.info(
         f"Scanning all log groups to find those with {VARIABLE_LOGGING_NAME} filters..."
     )
     
-    for log_group in describe_log_groups_generator():
-        log_group_name = log_group["logGroupName"]
-        try:
-            filters = cloudwatch_logs_client.describe_subscription_filters(
-                logGroupName=log_group_name,
-                filterNamePrefix=FILTER_NAME_PREFIX,
-            )
-            
-            if filters["subscriptionFilters"]:
-                log_groups_with_filters.append(log_group_name)
-                logger.debug(f"Found filter on: {log_group_name}")
-        except cloudwatch_logs_client.exceptions.ResourceNotFoundException:
-            # Log group was deleted between describe_log_groups and describe_subscription_filters
-            logger.debug(f"Log group no longer exists: {log_group_name}")
-        except Exception as error:
-            logger.warning(
-                f"Could not check filters for {log_group_name}: {error}"
+    lookups = []
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        # Queue each page's lookups while the next page is still being listed
+        for log_group_names in describe_log_group_name_pages():
+            lookups.extend(
+                (log_group_name, executor.submit(has_subscription_filter, log_group_name))
+                for log_group_name in log_group_names
             )
+        log_groups_with_filters = [
+            log_group_name for log_group_name, lookup in lookups if lookup.result()
+        ]
     
     logger.info(
         f"Found {len(log_groups_with_filters)} log groups with {VARIABLE_LOGGING_NAME} filters"
@@ -433,6 +745,35 @@ def get_log_groups_with_filters():
     return log_groups_with_filters
 
 
+def remove_subscription_filter(log_group_name):
+    """
+    Remove our subscription filter from a log group.
+    
+    Failures are logged rather than raised so one log group cannot stop the cleanup of the others.
+    
+    Args:
+        log_group_name (str): The name of the log group to remove the filter from
+    
+    Returns:
+        bool: True if the filter is gone, False if the removal failed
+    """
+    try:
+        cloudwatch_logs_client.delete_subscription_filter(
+            filterName=FILTER_NAME_PREFIX,
+            logGroupName=log_group_name,
+        )
+        logger.info(f"Successfully removed filter from {log_group_name}")
+    except cloudwatch_logs_client.exceptions.ResourceNotFoundException:
+        # Filter or log group no longer exists - this is fine
+        logger.info(f"Filter or log group already gone: {log_group_name}")
+    except Exception as error:
+        logger.error(
+            f"Failed to remove filter from {log_group_name}: {error}"
+        )
+        return False
+    return True
+
+
 def reconcile_subscription_filters():
     """
     Reconcile subscription filters to match current SSM parameter patterns.
@@ -450,12 +791,10 @@ def reconcile_subscription_filters():
     # Step 1: Get all current patterns that SHOULD have filters
     current_patterns = []
     try:
-        parameters = [item for item in get_parameters_generator()]
-        for parameter in parameters:
-            json_data = json.loads(parameter["Value"])
+        for _, json_data in get_all_parameters():
             pattern = json_data["log_group_name_pattern"]
             current_patterns.append(pattern)
-            logger.debug(f"Active pattern: {pattern}")
+            logger.debug("Active pattern: %s", pattern)
     except Exception as error:
         logger.error(f"Failed to retrieve SSM parameters: {error}")
         raise error
@@ -464,6 +803,16 @@ def reconcile_subscription_filters():
         f"Found {len(current_patterns)} active pattern(s) in SSM parameters"
     )
     
+    # With no patterns, filters can only exist if the tracking parameter records some,
+    # so skip the region-wide scan when it is confirmed absent or empty. If it could
+    # not be read, fall through to the full scan.
+    if not current_patterns:
+        if not any(get_tracking_list()) and not tracking_read_failed:
+            logger.info(
+                f"No active patterns and no tracked {VARIABLE_LOGGING_NAME} filters. Nothing to clean up."
+            )
+            return
+    
     # Step 2: Find ALL log groups that ACTUALLY have our subscription filter
     log_groups_with_filters = get_log_groups_with_filters()
     
@@ -472,31 +821,23 @@ def reconcile_subscription_filters():
             f"No log groups found with {VARIABLE_LOGGING_NAME} filters. Nothing to clean up."
         )
         # Clean up the SSM parameter if it exists
-        try:
-            ssm_client.delete_parameter(Name=FILTERS_TRACKING_PARAM)
-            logger.info(f"Deleted {FILTERS_TRACKING_PARAM} SSM parameter")
-        except ssm_client.exceptions.ParameterNotFound:
-            logger.debug(f"{FILTERS_TRACKING_PARAM} parameter does not exist")
+        delete_tracking_param()
         return
     
     # Step 3: Determine which filters should be removed
     filters_to_remove = []
     filters_to_keep = []
+    # Same pattern order as `current_patterns`, so the regex built for match_parameter is reused
+    patterns_regex = get_parameters_matcher()
     
     for log_group_name in log_groups_with_filters:
-        matches_any_pattern = False
-        matched_pattern = None
-        
-        for pattern in current_patterns:
-            if fnmatch.fnmatch(log_group_name, pattern):
-                matches_any_pattern = True
-                matched_pattern = pattern
-                break
+        match = patterns_regex.match(log_group_name)
         
-        if matches_any_pattern:
+        if match is not None:
+            matched_pattern = current_patterns[int(match.lastgroup[1:])]
             filters_to_keep.append(log_group_name)
             logger.debug(
-                f"Keeping filter on {log_group_name} (matches {matched_pattern})"
+                "Keeping filter on %s (matches %s)", log_group_name, matched_pattern
             )
         else:
             filters_to_remove.append(log_group_name)
@@ -512,24 +853,13 @@ def reconcile_subscription_filters():
     removed_count = 0
     failed_count = 0
     
-    for log_group_name in filters_to_remove:
-        try:
-            cloudwatch_logs_client.delete_subscription_filter(
-                filterName=FILTER_NAME_PREFIX,
-                logGroupName=log_group_name,
-            )
-            removed_count += 1
-            logger.info(f"Successfully removed filter from {log_group_name}")
-        except cloudwatch_logs_client.exceptions.ResourceNotFoundException:
-            # Filter or log group no longer exists - this is fine
-            logger.info(f"Filter or log group already gone: {log_group_name}")
-            removed_count += 1
-        except Exception as error:
-            failed_count += 1
-            logger.error(
-                f"Failed to remove filter from {log_group_name}: {error}"
-            )
-            # Continue processing - don't let one failure stop cleanup
+    # Deletions are independent, so they are issued concurrently
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        for removed in executor.map(remove_subscription_filter, filters_to_remove):
+            if removed:
+                removed_count += 1
+            else:
+                failed_count += 1
     
     logger.info(
         f"Cleanup complete: {removed_count} filters removed, {failed_count} failures"
@@ -537,18 +867,17 @@ def reconcile_subscription_filters():
     
     # Step 5: Update SSM parameter to reflect current patterns (for reference/auditing)
     if current_patterns:
-        subscription_filter_param(current_patterns)
+        replace_tracking_list(current_patterns)
         logger.info(
             f"Updated {FILTERS_TRACKING_PARAM} SSM parameter with current patterns"
         )
+    elif failed_count:
+        # Keep the parameter so the next run still knows there are filters left to remove
+        logger.warning(
+            f"Keeping {FILTERS_TRACKING_PARAM} SSM parameter until the remaining filters are removed"
+        )
     else:
-        try:
-            ssm_client.delete_parameter(Name=FILTERS_TRACKING_PARAM)
-            logger.info(
-                f"Deleted {FILTERS_TRACKING_PARAM} SSM parameter (no active patterns)"
-            )
-        except ssm_client.exceptions.ParameterNotFound:
-            logger.debug(f"{FILTERS_TRACKING_PARAM} parameter does not exist")
+        delete_tracking_param(" (no active patterns)")
 
 
 def subscription_filter_param(filterList):
@@ -573,71 +902,100 @@ def subscription_filter_param(filterList):
 # LAMBDA HANDLER
 # =============================================================================
 
-def lambda_handler(event, context):
+def handle_create_log_group(event):
     """
-    Main Lambda handler for processing EventBridge events.
+    Adds a Subscription Filter to the log group created by a CreateLogGroup event.
     
-    Processes CreateLogGroup, PutParameter, and DeleteParameter events to manage
-    CloudWatch Logs subscription filters and sync parameters to central account.
+    Args:
+        event (dict): The EventBridge event
     """
-    logger.info("Lambda invoked by EventBridge")
-    logger.debug(f"Event payload:\n{json.dumps(event, indent=4)}")
+    log_group_name = event["detail"]["requestParameters"]["logGroupName"]
+    logger.info(f"Processing CreateLogGroup event for: {log_group_name}")
+    add_subscription_filter_to_new_log_group(log_group_name)
+    logger.info(
+        f"Completed processing CreateLogGroup event for: {log_group_name}"
+    )
+
+
+def handle_parameter_change(event):
+    """
+    Applies a PutParameter or DeleteParameter event for a parameter under `SSM_PARAMETER_ROOT`.
+    
+    A new or updated parameter first gets filters added to its existing log groups. Both events
+    then reconcile all filters and sync the parameters to the central audit account.
     
+    Args:
+        event (dict): The EventBridge event
+    """
     event_name = event["detail"]["eventName"]
+    param_name = event["detail"]["requestParameters"]["name"]
+    if not param_name.startswith(SSM_PARAMETER_ROOT):
+        logger.info(
+            f"Skipping {event_name} event - not a {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
+        )
+        return
     
-    if event_name == "CreateLogGroup":
-        log_group_name = event["detail"]["requestParameters"]["logGroupName"]
-        logger.info(f"Processing CreateLogGroup event for: {log_group_name}")
-        add_subscription_filter_to_new_log_group(log_group_name)
+    logger.info(
+        f"Processing {event_name} event for {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
+    )
+    if event_name == "PutParameter":
+        update_subscription_filter_on_existing_log_groups(param_name)
         logger.info(
-            f"Completed processing CreateLogGroup event for: {log_group_name}"
+            "Reconciling all filters to remove orphaned subscriptions..."
         )
+    reconcile_subscription_filters()
     
-    elif event_name == "PutParameter":
-        param_name = event["detail"]["requestParameters"]["name"]
-        if SSM_PARAMETER_ROOT in param_name:
-            logger.info(
-                f"Processing PutParameter event for {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
-            )
-            update_subscription_filter_on_existing_log_groups(param_name)
-            logger.info(
-                "Reconciling all filters to remove orphaned subscriptions..."
-            )
-            reconcile_subscription_filters()
-            
-            # Sync to central audit account
-            logger.info("Syncing parameters to central audit account...")
-            sync_parameters_to_central_account()
-            
-            logger.info(
-                f"Completed processing PutParameter event for: {param_name}"
-            )
-        else:
-            logger.info(
-                f"Skipping PutParameter event - not a {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
-            )
+    # Sync to central audit account
+    logger.info("Syncing parameters to central audit account...")
+    sync_parameters_to_central_account()
     
-    elif event_name == "DeleteParameter":
-        param_name = event["detail"]["requestParameters"]["name"]
-        if SSM_PARAMETER_ROOT in param_name:
-            logger.info(
-                f"Processing DeleteParameter event for {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
-            )
-            reconcile_subscription_filters()
-            
-            # Sync to central audit account
-            logger.info("Syncing parameters to central audit account...")
-            sync_parameters_to_central_account()
-            
-            logger.info(
-                f"Completed processing DeleteParameter event for: {param_name}"
-            )
-        else:
-            logger.info(
-                f"Skipping DeleteParameter event - not a {VARIABLE_LOGGING_NAME.upper()} parameter: {param_name}"
-            )
+    logger.info(
+        f"Completed processing {event_name} event for: {param_name}"
+    )
+
+
+# Handler for each EventBridge event type this function processes
+EVENT_HANDLERS = {
+    "CreateLogGroup": handle_create_log_group,
+    "PutParameter": handle_parameter_change,
+    "DeleteParameter": handle_parameter_change,
+}
+
+
+def lambda_handler(event, context):
+    """
+    Main Lambda handler for processing EventBridge events.
     
-    else:
+    Processes CreateLogGroup, PutParameter, and DeleteParameter events to manage
+    CloudWatch Logs subscription filters and sync parameters to central account.
+    """
+    global parameters_cache, parameters_matcher, tracking_cache, tracking_changed, tracking_read_failed
+    parameters_cache = None
+    parameters_matcher = None
+    tracking_cache = None
+    tracking_changed = False
+    tracking_read_failed = False
+    
+    logger.info("Lambda invoked by EventBridge")
+    # Skip pretty-printing the event unless DEBUG output is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event payload:\n%s", json.dumps(event, indent=4))
+    
+    event_name = event["detail"]["eventName"]
+    handler = EVENT_HANDLERS.get(event_name)
+    if handler is None:
         logger.info(
             f"Skipping event - not a recognized event type: {event_name}"
         )
+        return
+    
+    try:
+        handler(event)
+    except Exception:
+        # Filters added before a failure are still recorded, without hiding the original error
+        try:
+            save_tracking_list()
+        except Exception as error:
+            logger.error(f"Failed to save {FILTERS_TRACKING_PARAM}: {error}")
+        raise
+    save_tracking_list()
@@ -21,7 +21,18 @@ module "lambda_function" {
   memory_size   = var.lambda_memory_size
 
 
-  source_path = var.lambda_source_path
+  source_path = [
+    {
+      path             = var.lambda_source_path
+      pip_requirements = fileexists("${var.lambda_source_path}/requirements.txt")
+      # Keep tests and bytecode caches out of the deployment package
+      patterns = [
+        "!tests/.*",
+        "!(.*/)?test_[^/]*\\.py",
+        "!(.*/)?__pycache__/.*",
+      ]
+    }
+  ]
 
   environment_variables = var.environment_variables
 
@@ -34,7 +34,7 @@ variable "lambda_timeout" {
 
 variable "lambda_memory_size" {
   type        = number
-  description = "Lambda memory in MB (128-10240)"
+  description = "Lambda memory in MB (128-10240). CPU scales with memory; 1792 MB (one full vCPU) is recommended for large log group counts"
   default     = 256
 }
 